@@ -0,0 +1,192 @@
+"""Headless benchmark of FourierCircles construction and per-frame cost.
+
+Times each stage separately (input loading, path sampling, coefficient computation,
+submobject construction, per-frame `_update_epicycles`, trace growth) over a grid of
+`n_vectors` x `n_samples` for MathTex, Square and SVG inputs. Nothing is rendered.
+
+    python benchmarks/bench_fourier_circles.py --output bench.json
+    python benchmarks/bench_fourier_circles.py --inputs square --n-vectors 100 500 --frames 300
+
+Results are printed (or written) as JSON so runs can be compared between commits.
+"""
+
+from manim import *
+import numpy as np
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mobjects.epicycle_core import fourier_coefficients, sorted_freqs
+from mobjects.fourier_circles import (
+    FourierCircles,
+    _fit_graph,
+    _pick_sampling_path,
+    sample_path,
+)
+from mobjects.fourier_trace import FourierTrace
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+INPUTS = {
+    "mathtex": lambda: MathTex(r"\pi"),
+    "square": lambda: Square().scale(2),
+    "svg": lambda: SVGMobject(os.path.join(REPO_ROOT, "images", "Gerald_G_Violin_2.svg")),
+}
+
+
+def _timed(func, repeat):
+    """Run `func` `repeat` times; return (last result, list of durations in seconds)."""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return result, durations
+
+
+def _summary(durations):
+    return {
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "max": max(durations),
+        "runs": len(durations),
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_case(input_name, n_vectors, n_samples, frames, repeat, vector_type, render_mode):
+    graph, load_times = _timed(INPUTS[input_name], repeat)
+    fitted, _ = _fit_graph(graph, True, False, 0.7, None, None)
+    sampling_path = _pick_sampling_path(fitted)
+
+    samples, sample_times = _timed(lambda: sample_path(sampling_path, n_samples), repeat)
+    freqs = sorted_freqs(n_vectors)
+    coefficients, coefficient_times = _timed(
+        lambda: fourier_coefficients(samples, freqs), repeat
+    )
+    epicycles, build_times = _timed(
+        lambda: FourierCircles(
+            freqs=freqs,
+            coefficients=coefficients,
+            vector_type=vector_type,
+            render_mode=render_mode,
+            cache=False,
+        ),
+        repeat,
+    )
+
+    dt = 1 / config.frame_rate
+    frame_times = []
+    traced_path = TracedPath(epicycles.get_end)
+    traced_times = []
+    fourier_trace = FourierTrace(epicycles)
+    fourier_trace_times = []
+    for frame in range(frames):
+        epicycles.vector_clock.set_value(frame * dt / 10)
+
+        start = time.perf_counter()
+        epicycles._update_epicycles(epicycles, dt)
+        frame_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        traced_path.update(dt)
+        traced_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        fourier_trace.update(dt)
+        fourier_trace_times.append(time.perf_counter() - start)
+
+    n_points = sum(len(m.get_points()) for m in epicycles.family_members_with_points())
+    return {
+        "input": input_name,
+        "n_vectors": n_vectors,
+        "n_samples": n_samples,
+        "vector_type": vector_type,
+        "render_mode": render_mode,
+        "frames": frames,
+        "submobjects": len(epicycles.get_family()),
+        "points": n_points,
+        "stages": {
+            "load_input": _summary(load_times),
+            "sample_path": _summary(sample_times),
+            "coefficients": _summary(coefficient_times),
+            "build_submobjects": _summary(build_times),
+            "update_epicycles_per_frame": _summary(frame_times),
+            "traced_path_per_frame": _summary(traced_times),
+            "fourier_trace_per_frame": _summary(fourier_trace_times),
+        },
+        "traced_path_points": len(traced_path.get_points()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inputs", nargs="+", default=list(INPUTS), choices=list(INPUTS))
+    parser.add_argument("--n-vectors", nargs="+", type=int, default=[10, 100, 500])
+    parser.add_argument("--n-samples", nargs="+", type=int, default=[2000, 20000])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--vector-type", default="arrow", choices=["arrow", "line"])
+    parser.add_argument("--render-mode", default="mobjects", choices=["mobjects", "flat"])
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for input_name in args.inputs:
+        for n_samples in args.n_samples:
+            for n_vectors in args.n_vectors:
+                try:
+                    results.append(
+                        bench_case(
+                            input_name,
+                            n_vectors,
+                            n_samples,
+                            args.frames,
+                            args.repeat,
+                            args.vector_type,
+                            args.render_mode,
+                        )
+                    )
+                except Exception as exc:
+                    results.append({
+                        "input": input_name,
+                        "n_vectors": n_vectors,
+                        "n_samples": n_samples,
+                        "error": f"{type(exc).__name__}: {exc}",
+                    })
+
+    report = {
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "frame_rate": config.frame_rate,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,12 @@ from matplotlib import axes
 from matplotlib.pyplot import PolarAxes
 from numpy import trace
 import scipy.integrate
+import os
+
+from mobjects.fourier_circles_gl import GLFourierCircles
+
+
+SVG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", "Gerald_G_Violin_2.svg")
 
 
 
@@ -116,8 +122,8 @@ class ComplexWave(Scene):
 
 class FourierStandardFixed2(Scene):
     def construct(self):
-		# SVG settings
-        path_mob = SVGMobject(r"C:\Users\F1339\Desktop\ManimLecture\manim\high_clef.svg") 
+        # SVG settings
+        path_mob = SVGMobject(SVG_FILE)
         path = path_mob.family_members_with_points()[0]
 
         # path_mob = Tex("\\pi")
@@ -129,61 +135,13 @@ class FourierStandardFixed2(Scene):
         path.set_stroke(WHITE, 1)
         path.set_fill(opacity=0)
 
-        # Fourier Calculations
-        n_vectors = 100 
-        n_samples = 2000
-        
-        t_range = np.linspace(0, 1, n_samples, endpoint=False)
-        points = [path.point_from_proportion(t) for t in t_range]
-        complex_points = np.array([p[0] + 1j * p[1] for p in points])
-        
-        # Frequencies
-        freqs = list(range(-n_vectors // 2, n_vectors // 2 + 1))
-        freqs.sort(key=abs) 
-        
-        coefficients = [
-            np.mean(complex_points * np.exp(-TAU * 1j * f * t_range))
-            for f in freqs
-        ]
-
-        # Vectors
-        vectors = VGroup()
-        circles = VGroup()
-        
-        for f, c in zip(freqs, coefficients):
-            mag = np.abs(c)
-            circle = Circle(radius=mag)
-            circle.set_stroke(BLUE_C, width=1, opacity=0.2)
-            circles.add(circle)
-            
-            # Use Line instead of Vectors
-            vec = Line(ORIGIN, mag * RIGHT)
-            vec.set_stroke(WHITE, width=1)
-            
-            vec.freq = f
-            vec.coeff = c 
-            vectors.add(vec)
-
-        # Updaters and Valuetracker: utilize the frequencies
-        self.vector_clock = ValueTracker(0)
-
-        def update_vectors(v_group):
-            t = self.vector_clock.get_value()
-            current_pos = ORIGIN 
-            
-            for i, v in enumerate(v_group):
-                z = v.coeff * np.exp(TAU * 1j * v.freq * t)
-                offset = np.array([z.real, z.imag, 0])
-                
-                circles[i].move_to(current_pos)
-                v.put_start_and_end_on(current_pos, current_pos + offset)
-                current_pos = v.get_end()
-
-        self.add(circles, vectors)
-        vectors.add_updater(update_vectors)
+        # Fourier Calculations (shared with the Manim CE scenes via mobjects.epicycle_core)
+        epicycles = GLFourierCircles(path, n_vectors=100, n_samples=2000)
+        self.vector_clock = epicycles.vector_clock
+        self.add(epicycles)
 
         # Path
-        trace = TracedPath(vectors[-1].get_end)
+        trace = TracedPath(epicycles.get_end)
         trace.set_stroke(YELLOW, 3) 
         self.add(trace)
 
@@ -2,6 +2,9 @@ from manim import *
 import numpy as np
 
 from mobjects.fourier_circles import FourierCircles
+from mobjects.fourier_trace import FourierTrace
+from mobjects.partial_sums import PartialSumSeries
+from mobjects.phase_wave import PhaseWave
 
 
 class ComplexWave(Scene):
@@ -68,7 +71,7 @@ class ComplexWave(Scene):
 
         self.play(FadeIn(graph4_static), Create(rec4))
 
-        graph4 = always_redraw(lambda: axes_mix.plot(func_complex, **plot_kwargs))
+        graph4 = PhaseWave(axes_mix, func_complex, x_range=plot_kwargs["x_range"], color=WHITE)
         self.remove(graph4_static)
         self.add(graph4)
 
@@ -78,7 +81,7 @@ class ComplexWave(Scene):
             zip(axes_components, arrows, graphs_static, recs)
         ):
             self.play(Create(arrow), Create(graph_static), Create(rec))
-            graph = always_redraw(lambda ax=ax, i=i: ax.plot(funcs[i], **plot_kwargs))
+            graph = PhaseWave(ax, funcs[i], x_range=plot_kwargs["x_range"], color=WHITE)
             self.remove(graph_static)
             self.add(graph)
             self.remove(dots[i])
@@ -103,8 +106,7 @@ class FourierStandardFixed2(Scene):
         )
         
 
-        trace = TracedPath(epicycles.get_end)
-        trace.set_stroke(YELLOW, 3)
+        trace = FourierTrace(epicycles, stroke_color=YELLOW, stroke_width=3)
         self.add(trace)
         self.play(Create(epicycles))
     
@@ -127,9 +129,6 @@ class PiecewiseExample(Scene):
             elif x == 0:
                 return 0
 
-        def component_func(n):
-            return lambda x: 4 / PI * (1 / (2 * n + 1)) * np.sin((2 * n + 1) * PI * x / 4)
-
         axes = Axes(
             y_range=[-2, 2, 1],
             x_range=[-5, 5, 1],
@@ -143,20 +142,14 @@ class PiecewiseExample(Scene):
         self.add(axes)
 
         component_number = 40
-
-        def combined_func(n):
-            return lambda x: sum(
-                (1 / (2 * k + 1)) * np.sin((2 * k + 1) * PI * x / 4) for k in range(n)
-            )
+        series = PartialSumSeries.sign_series(half_period=4, x_range=[-5, 5, 0.1])
 
         group = VGroup(axes)
 
         for i in range(component_number):
-            graph_init = axes.plot(component_func(i), x_range=[-5, 5, 0.1], color=BLUE)
-            graph_added = axes.plot(combined_func(i + 1), x_range=[-5, 5, 0.1], color=WHITE)
-            graph_added_behind = axes.plot(
-                combined_func(i + 1), x_range=[-5, 5, 0.1], color=WHITE
-            ).set_stroke(opacity=0.2)
+            graph_init = series.get_term_graph(axes, i, color=BLUE)
+            graph_added = series.get_graph(axes, i + 1, color=WHITE)
+            graph_added_behind = graph_added.copy().set_stroke(opacity=0.2)
 
             if i < 5:
                 self.play(FadeIn(graph_init))
@@ -3,26 +3,29 @@
 from manim import *
 
 from mobjects.fourier_circles import FourierCircles
+from mobjects.fourier_profile import FourierProfileMixin
+from mobjects.fourier_reconstruction import FourierReconstruction
+from mobjects.spectral_morph import SpectralMorph
+from mobjects.fourier_trace import FourierTrace
+from mobjects.phase_wave import PhaseWave
 
 
-class FourierIntroduction(Scene):
+class FourierIntroduction(FourierProfileMixin, Scene):
     """Intro scene demonstrating Fourier/epicycle animations."""
     def construct(self):
         image_set = [
             MathTex(r"\Pi").scale(2),
             MathTex(r"\Sigma").scale(2),
-            ImageMobject("images/Gerald_G_Violin_2.svg").scale(2),
-            ImageMobject("einstein.svg").scale(2),
-        ]
-        fourier_circles = [
-            FourierCircles(
-                input_graph=image,
-                vector_number=100,
-                n_samples=2000,
-                vector_type="arrow"
-            )
-            for image in image_set
+            SVGMobject("images/Gerald_G_Violin_2.svg").scale(2),
+            SVGMobject("einstein.svg").scale(2),
         ]
+        fourier_circles = FourierCircles.from_many(
+            image_set,
+            vector_number=100,
+            n_samples=2000,
+            vector_type="arrow",
+            lazy=True,
+        )
         self.add(fourier_circles[0])
 
 
@@ -39,9 +42,7 @@ class FourierIntroduction(Scene):
                 run_time=3,
                 rate_func=linear,
             )
-            next_circle.set_value(end_t)
-            self.remove(current)
-            self.add(next_circle)
+            self.play(SpectralMorph(current, next_circle), run_time=1)
 
         # add introduced texts
         introduction_text = Text("傅里叶级数", font_size=24)
@@ -120,7 +121,7 @@ class FourierIntroduction(Scene):
 
         self.play(FadeIn(static_merged_wave), Create(rec4_surrounding_split_waves))
 
-        graph4 = always_redraw(lambda: axes_mix.plot(merged_wave, **plot_kwargs))
+        graph4 = PhaseWave(axes_mix, merged_wave, x_range=plot_kwargs["x_range"], color=WHITE)
         self.remove(static_merged_wave)
         self.add(graph4)
 
@@ -140,7 +141,7 @@ class FourierIntroduction(Scene):
         )
 
         for i, (ax, _, graph_static, _) in enumerate(component_items):
-            graph = always_redraw(lambda ax=ax, i=i: ax.plot(funcs[i], **plot_kwargs))
+            graph = PhaseWave(ax, funcs[i], x_range=plot_kwargs["x_range"], color=WHITE)
             self.remove(graph_static)
             self.add(graph)
             self.remove(dots[i])
@@ -163,13 +164,19 @@ class FourierIntroduction(Scene):
         epicycles = FourierCircles(
             graph=square_wave,
             vector_number=10,
+            max_vectors=120,
             n_samples=2000,
             vector_type="arrow",
+            level_of_detail=True,
         )
         epicycles.set_value(0)
 
-        trace = TracedPath(epicycles.get_end)
-        trace.set_stroke(YELLOW, 3)
+        # The n-term approximation the trace will converge to, next to the target square.
+        approximation = FourierReconstruction(epicycles)
+        approximation.set_stroke(BLUE_B, width=2, opacity=0.35)
+        self.add(approximation)
+
+        trace = FourierTrace(epicycles, stroke_color=YELLOW, stroke_width=3)
         self.add(trace)
 
         self.play(Create(epicycles))
@@ -178,17 +185,9 @@ class FourierIntroduction(Scene):
         epicycles.start_orient(speed)
         for n_vectors in [25, 60, 120]:
             self.wait(3)
-            epicycles.start_orient(0)
-            new_epicycles = FourierCircles(
-                graph=square_wave,
-                vector_number=n_vectors,
-                n_samples=2000,
-                vector_type="arrow",
-            )
-            new_epicycles.set_value(epicycles.vector_clock.get_value())
-            self.play(ReplacementTransform(epicycles, new_epicycles), run_time=2)
-            epicycles = new_epicycles
-            epicycles.start_orient(speed)
+            epicycles.set_vector_count(n_vectors)
+            approximation.refresh()
+            self.wait(2)
 
         self.wait(3)
         epicycles.start_orient(0)
@@ -244,16 +243,13 @@ class FourierIntroduction(Scene):
             axis_config={"stroke_opacity": 0},
         )
         merged_axes.to_edge(LEFT, buff=0.7)
-        merged_wave = always_redraw(
-            lambda: merged_axes.plot(
-                lambda x: sum(
-                    a * np.sin(f * (x + merged_phase.get_value())) for f, a in random_signal
-                ),
-                x_range=[0, TAU, TAU / 200],
-                color=WHITE,
-                use_smoothing=False,
-            ).set_stroke(width=2)
-        )
+        merged_wave = PhaseWave(
+            merged_axes,
+            lambda x, phase: sum(a * np.sin(f * (x + phase)) for f, a in random_signal),
+            x_range=[0, TAU, TAU / 200],
+            phi=merged_phase,
+            color=WHITE,
+        ).set_stroke(width=2)
 
         for row in range(n_rows):
             left_cell = cells[row * n_cols]
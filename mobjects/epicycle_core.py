@@ -0,0 +1,340 @@
+"""Backend-independent epicycle math: sampling, spectra and chain evaluation.
+
+Pure NumPy (no Manim import), shared by the Manim CE mobjects in this package and the
+manimgl adapter. Paths are given as Bézier control point arrays, laid out like
+`VMobject.get_points()` (`n_points_per_curve` points per curve), and positions as
+complex numbers x + iy.
+"""
+
+import numpy as np
+from math import comb
+
+
+TAU = 2 * np.pi
+
+
+def _is_fast_fft_length(n):
+    """Return True if `n` only has the prime factors 2, 3 and 5."""
+    if n < 1:
+        return False
+    for p in (2, 3, 5):
+        while n % p == 0:
+            n //= p
+    return n == 1
+
+
+def fourier_coefficients(complex_points, freqs):
+    """Fourier coefficients of uniformly sampled points on [0, 1).
+
+    Equivalent to `[np.mean(complex_points * np.exp(-TAU * 1j * f * t_range)) for f in freqs]`,
+    in the same order as `freqs`, but computed with one `np.fft.fft` call. When the sample count
+    is an awkward FFT length and only a few frequencies are requested, the requested bins are
+    evaluated directly with a batched matrix product instead.
+    """
+    complex_points = np.asarray(complex_points, dtype=complex)
+    freqs = np.asarray(freqs, dtype=int)
+    n = len(complex_points)
+    if n == 0:
+        raise ValueError("fourier_coefficients requires at least one sample.")
+
+    if _is_fast_fft_length(n) or len(freqs) > 4 * np.log2(n):
+        return np.fft.fft(complex_points)[freqs % n] / n
+
+    # Direct DFT of the requested bins only, chunked to bound the temporary matrix.
+    t_range = np.arange(n) / n
+    coefficients = np.empty(len(freqs), dtype=complex)
+    chunk = max(1, (1 << 20) // n)
+    for start in range(0, len(freqs), chunk):
+        f = freqs[start:start + chunk]
+        basis = np.exp(-TAU * 1j * np.outer(f, t_range))
+        coefficients[start:start + chunk] = basis @ complex_points / n
+    return coefficients
+
+
+def vector_count_for_error(coefficients, max_error, total_energy=None):
+    """Index of the shortest prefix of `coefficients` whose partial sum is within `max_error`.
+
+    By Parseval, the mean squared distance between a curve and a partial sum of its
+    series is the energy of the omitted coefficients, so the RMS error of every prefix
+    follows from one cumulative sum. `total_energy` is the energy of the full series
+    (defaults to that of `coefficients`). Returns i such that the first i + 1
+    coefficients suffice, or the last index if none do.
+    """
+    energy = np.abs(np.asarray(coefficients, dtype=complex)) ** 2
+    if len(energy) == 0:
+        return 0
+    if total_energy is None:
+        total_energy = energy.sum()
+    error = np.sqrt(np.maximum(total_energy - np.cumsum(energy), 0))
+    within = error <= max_error
+    return int(np.argmax(within)) if within.any() else len(energy) - 1
+
+
+def _bernstein_basis(degree, u):
+    """Bernstein polynomials of `degree` evaluated at parameters `u`, shape (len(u), degree + 1)."""
+    u = np.asarray(u, dtype=float)[:, None]
+    i = np.arange(degree + 1)
+    binomials = np.array([comb(degree, k) for k in i], dtype=float)
+    return binomials * u**i * (1 - u) ** (degree - i)
+
+
+def sample_bezier_path(control_points, n_samples, n_points_per_curve=4, curve_samples=10):
+    """Sample `n_samples` points at uniform arc-length proportions in [0, 1).
+
+    `control_points` is a flat (n_curves * n_points_per_curve, dim) array of Bézier control
+    points, as returned by `VMobject.get_points()`. Each curve is evaluated at `curve_samples`
+    steps to build a cumulative arc-length table, which is then inverted for all proportions
+    at once.
+    """
+    control_points = np.asarray(control_points, dtype=float)
+    dim = control_points.shape[-1]
+    curves = control_points[: len(control_points) // n_points_per_curve * n_points_per_curve]
+    curves = curves.reshape(-1, n_points_per_curve, dim)
+    if len(curves) == 0:
+        raise ValueError("sample_bezier_path requires at least one Bézier curve.")
+    degree = n_points_per_curve - 1
+
+    table_basis = _bernstein_basis(degree, np.linspace(0, 1, curve_samples + 1))
+    table = np.einsum("uk,ckd->cud", table_basis, curves)
+    seg_lengths = np.linalg.norm(np.diff(table, axis=1), axis=-1).ravel()
+    cum_lengths = np.concatenate([[0.0], np.cumsum(seg_lengths)])
+
+    alphas = np.linspace(0, 1, n_samples, endpoint=False)
+    total = cum_lengths[-1]
+    if total == 0:
+        return np.repeat(curves[:1, 0], n_samples, axis=0)
+
+    targets = alphas * total
+    seg = np.clip(np.searchsorted(cum_lengths, targets, side="right") - 1, 0, len(seg_lengths) - 1)
+    seg_len = seg_lengths[seg]
+    frac = np.divide(
+        targets - cum_lengths[seg], seg_len, out=np.zeros_like(targets), where=seg_len > 0
+    )
+    curve_index, step = np.divmod(seg, curve_samples)
+    basis = _bernstein_basis(degree, (step + frac) / curve_samples)
+    return np.einsum("nk,nkd->nd", basis, curves[curve_index])
+
+
+def prune_spectrum(coefficients, energy_fraction=None, min_radius=None):
+    """Boolean mask of the coefficients worth drawing.
+
+    - `energy_fraction`: keep the smallest set of coefficients whose squared magnitudes
+      add up to at least this fraction of the total spectral energy.
+    - `min_radius`: drop coefficients whose magnitude (circle radius) is below it.
+
+    The largest coefficient is always kept.
+    """
+    magnitudes = np.abs(np.asarray(coefficients, dtype=complex))
+    keep = np.ones(len(magnitudes), dtype=bool)
+    if len(magnitudes) == 0:
+        return keep
+
+    if energy_fraction is not None and energy_fraction < 1:
+        energy = magnitudes**2
+        order = np.argsort(-energy, kind="stable")
+        cumulative = np.cumsum(energy[order])
+        n_keep = np.searchsorted(cumulative, energy_fraction * cumulative[-1]) + 1
+        energy_keep = np.zeros(len(magnitudes), dtype=bool)
+        energy_keep[order[:n_keep]] = True
+        keep &= energy_keep
+
+    if min_radius is not None:
+        keep &= magnitudes >= min_radius
+
+    keep[np.argmax(magnitudes)] = True
+    return keep
+
+
+def bezier_path_length(control_points, n_points_per_curve=4, curve_samples=10):
+    """Arc length of a piecewise Bézier path, measured on the same grid as the sampler."""
+    control_points = np.asarray(control_points, dtype=float)
+    dim = control_points.shape[-1]
+    curves = control_points[: len(control_points) // n_points_per_curve * n_points_per_curve]
+    curves = curves.reshape(-1, n_points_per_curve, dim)
+    basis = _bernstein_basis(n_points_per_curve - 1, np.linspace(0, 1, curve_samples + 1))
+    table = np.einsum("uk,ckd->cud", basis, curves)
+    return float(np.linalg.norm(np.diff(table, axis=1), axis=-1).sum())
+
+
+def next_fast_fft_length(n):
+    while not _is_fast_fft_length(n):
+        n += 1
+    return n
+
+
+def reconstruct_series(freqs, coefficients, n_points=None):
+    """Partial sum of an integer-frequency series at `M` uniform times t = k / M in [0, 1).
+
+    Scatters the coefficients into a length-M spectrum and applies one `np.fft.ifft`, so
+    the whole closed curve costs O(M log M). M is at least `n_points` and always above
+    2 * max|f| so no frequency aliases; it is rounded up to a fast FFT length. Returns M
+    complex samples.
+    """
+    freqs = np.asarray(freqs)
+    if np.any(np.mod(freqs, 1) != 0):
+        raise ValueError("reconstruct_series requires integer frequencies.")
+    freqs = freqs.astype(int)
+    bandwidth = 2 * int(np.abs(freqs).max(initial=0)) + 1
+    n = next_fast_fft_length(max(n_points or 0, bandwidth, 2))
+    spectrum = np.zeros(n, dtype=complex)
+    np.add.at(spectrum, freqs % n, np.asarray(coefficients, dtype=complex))
+    return np.fft.ifft(spectrum) * n
+
+
+def contour_spectra(contours, n_samples, n_vectors, n_points_per_curve=4):
+    """Spectra of several contours, to be drawn as synchronized epicycle chains.
+
+    `contours` is a list of Bézier control point arrays. Samples and vectors are split
+    between contours in proportion to their arc length. Sample counts are rounded up to
+    powers of two, so contours of similar length share a count and are transformed together
+    in one 2-D `np.fft.fft` call: a handful of calls however many contours there are, for
+    at most twice the proportional samples. Returns flat `(freqs, coefficients, chains)` arrays, where
+    `chains[i]` is the contour index of entry i and each chain is ordered by |f|.
+    """
+    lengths = np.array([bezier_path_length(c, n_points_per_curve) for c in contours])
+    contours = [c for c, length in zip(contours, lengths) if length > 0]
+    lengths = lengths[lengths > 0]
+    if len(contours) == 0:
+        raise ValueError("contour_spectra requires at least one contour with nonzero length.")
+
+    shares = lengths / lengths.sum()
+    sample_counts = [
+        1 << int(np.ceil(np.log2(max(16, int(round(n_samples * s)))))) for s in shares
+    ]
+    orders = [
+        min(max(2, int(round(n_vectors * s))), n - 1) for s, n in zip(shares, sample_counts)
+    ]
+    samples = [
+        sample_bezier_path(c, n, n_points_per_curve) for c, n in zip(contours, sample_counts)
+    ]
+
+    spectra = [None] * len(contours)
+    for n in sorted(set(sample_counts)):
+        batch = [i for i, count in enumerate(sample_counts) if count == n]
+        points = np.stack([samples[i][:, 0] + 1j * samples[i][:, 1] for i in batch])
+        transformed = np.fft.fft(points, axis=1) / n
+        for row, i in zip(transformed, batch):
+            freqs = np.array(sorted_freqs(orders[i]))
+            spectra[i] = (freqs, row[freqs % n])
+
+    freqs = np.concatenate([f for f, _ in spectra])
+    coefficients = np.concatenate([c for _, c in spectra])
+    chains = np.concatenate([np.full(len(f), i) for i, (f, _) in enumerate(spectra)])
+    return freqs, coefficients, chains
+
+
+# Radial error of the cubic Bézier approximation of a quarter circle, per unit radius.
+_QUARTER_ARC_ERROR = 2.7e-4
+
+
+def circle_curve_count(radius_px, tolerance_px=0.25, max_curves=8):
+    """Fewest cubic arcs drawing a circle of `radius_px` pixels within `tolerance_px`.
+
+    An arc spanning 2*pi/n deviates from the circle by about `2.7e-4 * r * (4 / n)**6`.
+    Returns 0 for sub-pixel circles (diameter below one pixel) and at most `max_curves`,
+    which matches `Circle`'s default resolution.
+    """
+    if radius_px < 0.5:
+        return 0
+    n = int(np.ceil(4 * (_QUARTER_ARC_ERROR * radius_px / tolerance_px) ** (1 / 6)))
+    return int(np.clip(n, 2, max_curves))
+
+
+def corner_template(corners):
+    """Complex cubic-Bézier points of the polyline through complex `corners`."""
+    corners = np.asarray(corners, dtype=complex)
+    weights = np.array([0, 1 / 3, 2 / 3, 1])
+    starts, ends = corners[:-1, None], corners[1:, None]
+    return (starts + (ends - starts) * weights).ravel()
+
+
+def sorted_freqs(n_vectors):
+    """Frequencies -n//2 .. n//2, ordered by |f| (negative first on ties)."""
+    freqs = list(range(-n_vectors // 2, n_vectors // 2 + 1))
+    freqs.sort(key=abs)
+    return freqs
+
+
+def chain_totals(freqs, coefficients, t):
+    """Running sums `[0, z_0, z_0 + z_1, ...]` of the phasors `z_k = c_k exp(2 pi i f_k t)`.
+
+    Entry k is where vector k starts and entry k + 1 where it ends; the last one is the tip.
+    """
+    phasors = np.asarray(coefficients) * np.exp(TAU * 1j * np.asarray(freqs) * t)
+    return np.concatenate([[0], np.cumsum(phasors)])
+
+
+def evaluate_chain(freqs, coefficients, ts, joints=False):
+    """Chain positions at every clock value in `ts`, as complex numbers.
+
+    Returns the tips, shape (len(ts),), or with `joints=True` all running sums as in
+    `chain_totals`, shape (len(ts), n + 1). Evaluated as one phasor matrix product (tips)
+    or cumsum (joints), in chunks of `ts` to bound memory.
+    """
+    ts = np.atleast_1d(np.asarray(ts, dtype=float))
+    freqs = np.asarray(freqs)
+    coefficients = np.asarray(coefficients)
+    if joints:
+        z = np.zeros((len(ts), len(freqs) + 1), dtype=complex)
+    else:
+        z = np.zeros(len(ts), dtype=complex)
+    chunk = max(1, (1 << 20) // max(1, len(freqs)))
+    for start in range(0, len(ts), chunk):
+        basis = np.exp(TAU * 1j * np.outer(ts[start:start + chunk], freqs))
+        if joints:
+            np.cumsum(basis * coefficients, axis=1, out=z[start:start + chunk, 1:])
+        else:
+            z[start:start + chunk] = basis @ coefficients
+    return z
+
+
+def concat_templates(vector_templates):
+    """Group per-vector point templates by the object they are written to.
+
+    `vector_templates[i]` lists `(target, points)` pairs for vector i, where `points` are
+    the complex points of a shape built at the origin for vector i's phasor pointing
+    along +x. Targets are opaque (mobjects in the adapters) and compared by identity, so a
+    target shared by several vectors gets one contiguous slice. Returns
+    `(targets, bounds, owner, template)`: the targets in first-seen order, the slice
+    bounds of each in `template`, the vector index of every point and all points.
+    """
+    targets = []
+    target_index = {}
+    pieces = []
+    for i, templates in enumerate(vector_templates):
+        for target, points in templates:
+            k = target_index.get(id(target))
+            if k is None:
+                k = target_index[id(target)] = len(targets)
+                targets.append(target)
+                pieces.append([])
+            pieces[k].append((points, i))
+
+    template = []
+    owner = []
+    for target_pieces in pieces:
+        template.append(np.concatenate([p for p, _ in target_pieces]))
+        owner.append(np.concatenate([np.full(len(p), i) for p, i in target_pieces]))
+    bounds = np.cumsum([0] + [len(t) for t in template])
+    owner = np.concatenate(owner) if owner else np.zeros(0, dtype=int)
+    template = np.concatenate(template) if template else np.zeros(0, dtype=complex)
+    return targets, bounds, owner, template
+
+
+def place_templates(template, owner, phasors, starts, magnitudes):
+    """Rotate, scale and move the templates of `concat_templates` onto the chain.
+
+    The points of vector i become `template * phasors[i] / magnitudes[i] + starts[i]`,
+    where `magnitudes` are the (non-zero) lengths the templates were built with. One
+    vectorized pass over all points, whatever the number of vectors.
+    """
+    return template * (phasors / magnitudes)[owner] + starts[owner]
+
+
+def to_points(z):
+    """Complex positions as an array of 3D points (z = 0), shape `z.shape + (3,)`."""
+    z = np.asarray(z)
+    points = np.zeros(z.shape + (3,))
+    points[..., 0] = z.real
+    points[..., 1] = z.imag
+    return points
@@ -0,0 +1,103 @@
+from manim import config
+import numpy as np
+import hashlib
+import os
+import tempfile
+
+
+# Bump when the sampling or coefficient math changes so stale entries are never reused.
+CACHE_VERSION = 2
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_dir():
+    """Cache directory: `$FOURIER_CACHE_DIR`, or `fourier_cache/` under Manim's media dir."""
+    return os.environ.get("FOURIER_CACHE_DIR") or os.path.join(config.media_dir, "fourier_cache")
+
+
+def spectrum_key(control_points, **params):
+    """Content hash of a path's control points plus the parameters that shape its spectrum."""
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION};".encode())
+    h.update(np.ascontiguousarray(control_points, dtype=np.float64).tobytes())
+    for name in sorted(params):
+        h.update(f"{name}={params[name]!r};".encode())
+    return h.hexdigest()
+
+
+class SpectrumCache:
+    """Size-bounded LRU cache of (freqs, coefficients) pairs stored as `.npz` files.
+
+    Recency is tracked through file modification times: hits touch their entry, and
+    writes evict the least recently used entries until the directory fits `max_bytes`.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = str(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def load(self, key):
+        """Return `(freqs, coefficients, chains)` for `key`, or None on a miss.
+
+        `chains` is None for single-chain spectra. An entry that cannot be read (truncated,
+        corrupt, missing arrays) counts as a miss and is deleted, so it is recomputed.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                freqs = data["freqs"]
+                coefficients = data["coefficients"]
+                chains = data["chains"] if "chains" in data.files else None
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # BadZipFile, EOFError, KeyError, ... depending on how the file is damaged.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return freqs, coefficients, chains
+
+    def store(self, key, freqs, coefficients, chains=None):
+        path = self._path(key)
+        tmp_path = None
+        arrays = dict(freqs=np.asarray(freqs), coefficients=np.asarray(coefficients))
+        if chains is not None:
+            arrays["chains"] = np.asarray(chains)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # A unique file per writer: threads of one process may store the same key.
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+            self.evict()
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def evict(self):
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".npz"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
@@ -1,7 +1,161 @@
 from manim import *
 import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from mobjects.epicycle_core import (
+    chain_totals,
+    circle_curve_count,
+    concat_templates,
+    contour_spectra,
+    corner_template,
+    evaluate_chain,
+    fourier_coefficients,
+    place_templates,
+    prune_spectrum,
+    sample_bezier_path,
+    sorted_freqs,
+    to_points,
+    vector_count_for_error,
+)
+from mobjects.fourier_cache import SpectrumCache, spectrum_key
+from mobjects.fourier_profile import UpdaterStats, profiling_enabled
+from mobjects.fourier_spectrum import (
+    PRECISIONS,
+    Spectrum,
+    load_spectrum_file,
+    save_spectrum_file,
+)
+
+
+DEFAULT_N_VECTORS = 100
+
+# Arrows whose tip would be shorter than this many pixels are drawn as plain lines.
+LOD_MIN_TIP_PX = 2.0
+
+
+def sample_path(path, n_samples):
+    """Sample a path at `n_samples` uniform proportions and return them as complex numbers."""
+    try:
+        control_points = path.get_points()
+    except AttributeError:
+        control_points = []
+    n_points_per_curve = getattr(path, "n_points_per_cubic_curve", 4)
+
+    if len(control_points) >= n_points_per_curve:
+        points = sample_bezier_path(control_points, n_samples, n_points_per_curve)
+    else:
+        t_range = np.linspace(0, 1, n_samples, endpoint=False)
+        points = np.array([path.point_from_proportion(t) for t in t_range])
+    return points[:, 0] + 1j * points[:, 1]
+
+
+def _source_identity(graph):
+    """Short human-readable description of an input graph, recorded in saved spectra."""
+    if graph is None:
+        return ""
+    if isinstance(graph, (str, os.PathLike)):
+        return str(graph)
+    for attr in ("tex_string", "text", "file_name"):
+        value = getattr(graph, attr, None)
+        if value:
+            return f"{type(graph).__name__}:{value}"
+    return type(graph).__name__
+
+
+def _load_graph(graph):
+    """Turn an SVG file path into an `SVGMobject`; pass mobjects through."""
+    if isinstance(graph, (str, os.PathLike)):
+        return SVGMobject(str(graph))
+    return graph
+
+
+def _pick_sampling_path(mob):
+    if hasattr(mob, "point_from_proportion") and (
+        not hasattr(mob, "has_no_points") or not mob.has_no_points()
+    ):
+        return mob
+
+    if hasattr(mob, "family_members_with_points"):
+        members = mob.family_members_with_points()
+        if members:
+            def score(m):
+                try:
+                    return len(m.get_all_points())
+                except Exception:
+                    try:
+                        return len(m.get_points())
+                    except Exception:
+                        return 0
+
+            return max(members, key=score)
+
+    raise TypeError(
+        "input_graph must be a VMobject/path (with point_from_proportion) or a Mobject "
+        "that contains such submobjects (e.g. Text/MathTex)."
+    )
+
+
+def _fit_graph(graph, auto_fit, force_fit, fit_fraction, fit_height, fit_width):
+    """Return a copy of `graph`, scaled and centered per the auto-fit options.
+
+    Also returns the applied transform as `(scale, offset)`, so a point p of the input maps
+    to `scale * p + offset`.
+    """
+    graph = graph.copy()
+    scale = 1.0
+    offset = np.zeros(3)
+
+    should_fit = auto_fit and (
+        fit_height is not None
+        or fit_width is not None
+        or isinstance(graph, (Text, Tex, MathTex))
+        or force_fit
+    )
+
+    if should_fit:
+        width, height, center = graph.width, graph.height, graph.get_center()
+        if fit_height is None:
+            fit_height = config.frame_height * fit_fraction
+        if fit_width is None:
+            fit_width = config.frame_width * fit_fraction
+
+        try:
+            graph.scale_to_fit_height(fit_height)
+        except Exception:
+            pass
+
+        if graph.width > fit_width:
+            try:
+                graph.scale_to_fit_width(fit_width)
+            except Exception:
+                pass
+
+        graph.center()
+
+        if height > 0:
+            scale = graph.height / height
+        elif width > 0:
+            scale = graph.width / width
+        offset = graph.get_center() - scale * center
+
+    return graph, (scale, offset)
+
+
+def _spectrum_cache_key(sampling_path, n_samples, order, fit_params):
+    return spectrum_key(
+        sampling_path.get_points(), n_samples=n_samples, n_vectors=order, fit=fit_params
+    )
+
 
+_PREFETCH_POOL = None
+
+
+def _prefetch_pool():
+    global _PREFETCH_POOL
+    if _PREFETCH_POOL is None:
+        _PREFETCH_POOL = ThreadPoolExecutor(max_workers=max(1, min(4, os.cpu_count() or 1)))
+    return _PREFETCH_POOL
 
 
 class FourierCircles(VGroup):
@@ -11,15 +165,52 @@ class FourierCircles(VGroup):
     - Accepts an input shape via `graph` / `input_graph`:
     - A VMobject/path with `point_from_proportion`, OR
     - Higher-level mobjects like `Text` / `MathTex` (a subpath is automatically selected).
+    - `contours="all"` decomposes every subpath of the input instead, drawn as synchronized
+      chains (one per contour) sharing `vector_clock`; samples and vectors are split by arc
+      length. `get_chain_end(i)` returns the tip of chain i.
+    - `evaluate(ts, joints=False)` gives tip (or all joint) positions for many clock
+      values at once, e.g. for traces, bounds or exports.
     - Computes Fourier coefficients internally from the input shape (sampling over [0, 1)).
+      Passing `freqs`/`coefficients` together with a graph uses them as that graph's
+      precomputed (unscaled) spectrum; `from_many` uses this to build inputs in parallel.
     - Provides animated epicycles (circles + vectors) driven by a built-in `ValueTracker`:
     - Animate via `UpdateFromAlphaFunc(..., lambda m, a: m.set_value(...))` or use `start_orient(speed)`.
+    - `max_vectors` precomputes the spectrum up to a larger order so `set_vector_count(n)`
+      can grow or shrink the chain in place without resampling.
     - Vector rendering modes:
     - `vector_type="line"` or `vector_type="arrow"`.
+    - `render_mode="mobjects"` (one Circle/Arrow per frequency) or `render_mode="flat"`
+      (all circles in one VMobject, all vectors in another) for large vector counts.
     - Size controls:
     - `scale_factor` (alias `size`) scales all coefficients (and thus overall epicycle size).
     - Auto-fit controls for Text/MathTex (and optional forcing for other inputs):
         `auto_fit`, `force_fit`, `fit_fraction`, `fit_height`, `fit_width`.
+    - `max_error_px` picks the vector count instead of `n_vectors`: the full spectrum is
+      computed once (up to `max_vectors`, else all `n_samples` bins) and the smallest
+      count whose RMS reconstruction error (Parseval) is below that many output pixels is
+      used.
+    - Pruning of visually negligible vectors: `energy_fraction` (e.g. 0.999 of the spectral
+      energy) and/or `min_radius_px` (radius threshold in output pixels); the number of
+      dropped vectors is stored in `n_pruned`.
+    - On-disk spectrum cache keyed by the sampled path's control points:
+        `cache=True/False`, `cache_dir` (defaults to `media/fourier_cache`).
+    - `lazy=True` defers sampling, coefficients and submobject creation until the mobject
+      is first added, copied, rendered or driven (`set_value`, `get_end`, ...);
+      `prefetch()` computes the spectrum ahead in a background thread.
+    - `keyframes=n` precomputes the chain positions at n clock samples per period (float32)
+      so `set_value(t)` becomes an interpolated table lookup; integer frequencies only.
+    - The spectrum is held in a `Spectrum` of contiguous read-only arrays (`spectrum` for
+      the full one; `freqs`, `coefficients`, `chains` for the active vectors), shared by
+      reference between copies. `precision="single"` stores it and the point templates
+      as complex64/float32.
+    - `level_of_detail=True` sizes every submobject by its on-screen radius (from
+      `config.pixel_width / config.frame_width`): circles get just enough Bézier arcs,
+      sub-pixel circles and vectors are skipped, and arrows too short for a visible tip
+      are drawn as lines.
+    - Opt-in instrumentation (`profile=True` or `$FOURIER_PROFILE=1`): updaters are wrapped
+      to record per-frame timings into `stats` (an `UpdaterStats`, else None);
+      `stats.watch_trace(trace)` adds a trace. `profile_callback(name, seconds, touched)`
+      is called per record.
     Epicycle (Fourier series) visualization as a reusable Manim mobject.
     """
     def __init__(
@@ -27,13 +218,17 @@ class FourierCircles(VGroup):
         graph=None,
         input_graph=None,
         svg_file=None,
-        n_vectors=100,
+        n_vectors=None,
         vector_number=None,
+        max_vectors=None,
         n_samples=2000,
         freqs=None,
         coefficients=None,
+        chains=None,
+        contours="largest",
         vector_clock=None,
         vector_type="arrow",
+        render_mode="mobjects",
         auto_fit=True,
         force_fit=False,
         fit_fraction=0.7,
@@ -41,11 +236,22 @@ class FourierCircles(VGroup):
         fit_width=None,
         scale_factor=1.0,
         size=None,
+        energy_fraction=None,
+        min_radius_px=None,
         circle_color=BLUE_C,
         circle_stroke_width=1,
         circle_opacity=0.2,
         vector_color=WHITE,
         vector_stroke_width=1,
+        cache=True,
+        cache_dir=None,
+        profile=None,
+        profile_callback=None,
+        lazy=False,
+        keyframes=None,
+        precision="double",
+        level_of_detail=False,
+        max_error_px=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -54,132 +260,622 @@ class FourierCircles(VGroup):
             graph = input_graph
         if graph is None:
             graph = svg_file
-        if isinstance(graph, (str, os.PathLike)):
-            graph = SVGMobject(str(graph))
+        self.source = _source_identity(graph)
+        graph = _load_graph(graph)
         if vector_number is not None:
             n_vectors = vector_number
+        # Without a graph, an explicit n_vectors keeps only the leading entries of the given
+        # spectrum (as `from_spectrum` restores); by default all of them are used.
+        self._requested_vectors = n_vectors
+        if n_vectors is None:
+            n_vectors = DEFAULT_N_VECTORS
         if size is not None:
             scale_factor = size
 
-        def _pick_sampling_path(mob):
-            if hasattr(mob, "point_from_proportion"):
-                return mob
-
-            if hasattr(mob, "family_members_with_points"):
-                members = mob.family_members_with_points()
-                if members:
-                    def score(m):
-                        try:
-                            return len(m.get_all_points())
-                        except Exception:
-                            try:
-                                return len(m.get_points())
-                            except Exception:
-                                return 0
-
-                    return max(members, key=score)
-
-            raise TypeError(
-                "input_graph must be a VMobject/path (with point_from_proportion) or a Mobject "
-                "that contains such submobjects (e.g. Text/MathTex)."
-            )
-
+        self.fit_transform = None
         if graph is not None:
-            graph = graph.copy()
-
-            should_fit = auto_fit and (
-                fit_height is not None
-                or fit_width is not None
-                or isinstance(graph, (Text, Tex, MathTex))
-                or force_fit
+            graph, self.fit_transform = _fit_graph(
+                graph, auto_fit, force_fit, fit_fraction, fit_height, fit_width
             )
 
-            if should_fit:
-                if fit_height is None:
-                    fit_height = config.frame_height * fit_fraction
-                if fit_width is None:
-                    fit_width = config.frame_width * fit_fraction
-
-                try:
-                    graph.scale_to_fit_height(fit_height)
-                except Exception:
-                    pass
-
-                if graph.width > fit_width:
-                    try:
-                        graph.scale_to_fit_width(fit_width)
-                    except Exception:
-                        pass
-
-                graph.center()
-
+        if contours not in ("largest", "all"):
+            raise ValueError(f"Unknown contours {contours!r}; use 'largest' or 'all'.")
+        self.contours = contours
         self.graph = graph
-        self.sampling_path = _pick_sampling_path(graph) if graph is not None else None
+        self.sampling_path = None
+        if graph is not None and contours == "largest":
+            self.sampling_path = _pick_sampling_path(graph)
         self.n_vectors = n_vectors
         self.n_samples = n_samples
 
-        if self.sampling_path is not None:
-            t_range = np.linspace(0, 1, self.n_samples, endpoint=False)
-            points = [self.sampling_path.point_from_proportion(t) for t in t_range]
-            complex_points = np.array([p[0] + 1j * p[1] for p in points])
-
-            freqs = list(range(-self.n_vectors // 2, self.n_vectors // 2 + 1))
-            freqs.sort(key=abs)
-            coefficients = [
-                np.mean(complex_points * np.exp(-TAU * 1j * f * t_range)) for f in freqs
-            ]
-
-        if freqs is None or coefficients is None:
+        self.scale_factor = scale_factor
+        self.energy_fraction = energy_fraction
+        self.min_radius_px = min_radius_px
+        if max_error_px is not None and self.contours == "all":
+            raise ValueError("max_error_px is not supported with contours='all'.")
+        self.max_error_px = max_error_px
+        self.n_pruned = 0
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}; use 'double' or 'single'.")
+        self.precision = precision
+        self.level_of_detail = level_of_detail
+        self._samples = None
+        self._cache = cache
+        self._cache_dir = cache_dir
+        self._fit_params = (auto_fit, force_fit, fit_fraction, fit_height, fit_width)
+
+        self._spectrum_order = max(self.n_vectors, max_vectors or 0)
+        if max_error_px is not None:
+            self._spectrum_order = max_vectors or n_samples - 1
+        self._given_spectrum = (freqs, coefficients, chains)
+        if graph is None and (freqs is None or coefficients is None):
             raise ValueError("FourierCircles requires either graph=... or (freqs, coefficients).")
 
-        self.freqs = list(freqs)
-        self.coefficients = [scale_factor * c for c in coefficients]
         self.vector_clock = vector_clock if vector_clock is not None else ValueTracker(0)
         self.vector_type = vector_type
+        if render_mode not in ("mobjects", "flat"):
+            raise ValueError(f"Unknown render_mode {render_mode!r}; use 'mobjects' or 'flat'.")
+        self.render_mode = render_mode
+        self._circle_style = dict(
+            color=circle_color, width=circle_stroke_width, opacity=circle_opacity
+        )
+        self._vector_style = dict(color=vector_color, width=vector_stroke_width)
 
         self._orient_updater = None
+        self.stats = None
+        if profiling_enabled(profile):
+            self.stats = UpdaterStats(self.source or type(self).__name__, profile_callback)
 
         self.circles = VGroup()
         self.vectors = VGroup()
+        self._vector_templates = []
+        self._end_points = np.zeros((1, 3))
+        if keyframes is not None and keyframes < 2:
+            raise ValueError(f"keyframes must be at least 2, got {keyframes}.")
+        self.keyframes = keyframes
+        self._keyframe_table = None
+        self._prefetched = None
+        self._pending_build = True
+        if not lazy:
+            self._ensure_built()
+
+    def _spectrum_inputs(self):
+        """Unscaled (freqs, coefficients, chains), computed unless given to the constructor."""
+        freqs, coefficients, chains = self._given_spectrum
+        if freqs is None or coefficients is None:
+            if self.sampling_path is not None:
+                freqs, coefficients = self._compute_spectrum(self._spectrum_order)
+            else:
+                freqs, coefficients, chains = self._compute_contour_spectrum()
+        return freqs, coefficients, chains
 
-        for f, c in zip(self.freqs, self.coefficients):
-            mag = np.abs(c)
+    def prefetch(self):
+        """Compute the spectrum of a lazy mobject in a background thread.
 
-            circle = Circle(radius=mag)
-            circle.set_stroke(circle_color, width=circle_stroke_width, opacity=circle_opacity)
-            self.circles.add(circle)
+        Submobjects are still created on the main thread when the mobject is first used.
+        """
+        if self._pending_build and self._prefetched is None:
+            self._prefetched = _prefetch_pool().submit(self._spectrum_inputs)
+        return self
 
+    def _ensure_built(self):
+        """Materialize the spectrum and submobjects of a lazy mobject (no-op once built)."""
+        if not getattr(self, "_pending_build", False):
+            return self
+        self._pending_build = False
+        if self._prefetched is not None:
+            freqs, coefficients, chains = self._prefetched.result()
+            self._prefetched = None
+        else:
+            freqs, coefficients, chains = self._spectrum_inputs()
+        self._given_spectrum = None
+
+        self._set_spectrum(freqs, coefficients, chains)
+        if self.max_error_px is not None:
+            self.n_vectors = self._vector_count_for_error(self.max_error_px)
+        if self.sampling_path is not None:
+            n_active = self._active_count(self.n_vectors)
+        elif self.max_error_px is not None:
+            n_active = self.n_vectors + 1
+        else:
+            n_active = len(self.spectrum)
+            if self.graph is None:
+                if self._requested_vectors is not None:
+                    n_active = min(n_active, self._requested_vectors + 1)
+                self.n_vectors = n_active - 1
+        self._active = self.spectrum[:n_active]
+
+        if self.render_mode == "flat":
+            circle_path = VMobject().set_stroke(**self._circle_style)
+            vector_path = VMobject().set_stroke(**self._vector_style)
+            self.circles.add(circle_path)
+            self.vectors.add(vector_path)
+            self._flat_members = [circle_path, vector_path]
             if self.vector_type == "arrow":
-                vec = Arrow(ORIGIN, mag * RIGHT, buff=0)
-            else:
-                vec = Line(ORIGIN, mag * RIGHT)
-            vec.set_stroke(vector_color, width=vector_stroke_width)
+                tip_path = VMobject().set_stroke(**self._vector_style)
+                tip_path.set_fill(self._vector_style["color"], opacity=1)
+                self.vectors.add(tip_path)
+                self._flat_members.append(tip_path)
+            self._unit_circles = {}
 
-            vec.freq = f
-            vec.coeff = c
-            self.vectors.add(vec)
+        for c in self._active.coefficients:
+            self._add_vector(c)
 
         self.add(self.circles, self.vectors)
+        self._build_templates()
         self._epicycles_updater = self._update_epicycles
+        if self.stats is not None:
+            self._epicycles_updater = self.stats.wrap(
+                "update_epicycles",
+                lambda mob, dt: mob._update_epicycles(mob, dt),
+                touched=lambda mob: len(mob._template_members),
+            )
         self.add_updater(self._epicycles_updater)
         self._update_epicycles(self, 0)
+        return self
 
-    def _update_epicycles(self, mob, dt=0):
-        t = self.vector_clock.get_value()
-        current_pos = ORIGIN
+    @property
+    def freqs(self):
+        """Frequencies of the active vectors (read-only array)."""
+        self._ensure_built()
+        return self._active.freqs
+
+    @property
+    def coefficients(self):
+        """Scaled complex coefficients of the active vectors (read-only array)."""
+        self._ensure_built()
+        return self._active.coefficients
+
+    @property
+    def chains(self):
+        """Chain index of every active vector (read-only array)."""
+        self._ensure_built()
+        return self._active.chains
+
+    def get_family(self, recurse=True):
+        self._ensure_built()
+        return super().get_family(recurse)
+
+    def __deepcopy__(self, memo):
+        # Build before copying, also when copied through a parent group: copies share the
+        # result instead of each computing it, and no pending prefetch Future is copied.
+        self._ensure_built()
+        return super().__deepcopy__(memo)
+
+    @classmethod
+    def from_many(cls, inputs, executor="thread", max_workers=None, **kwargs):
+        """Build one FourierCircles per input, computing the spectra in a worker pool.
+
+        Every input is loaded and fitted once, by its own constructor. With
+        `executor="thread"` the path sampling and coefficients of each input run in the
+        pool; with `executor="process"` the inputs are sampled in the calling process,
+        since mobjects are not safe to send to workers, and only the coefficients are
+        computed in the pool. `kwargs` are passed to every constructor. Returns the
+        mobjects in input order. With `lazy=True` each mobject prefetches its spectrum in
+        the background instead; with `contours="all"` they are built one after another.
+        """
+        if executor == "process":
+            pool_cls = ProcessPoolExecutor
+        elif executor == "thread":
+            pool_cls = ThreadPoolExecutor
+        else:
+            raise ValueError(f"Unknown executor {executor!r}; use 'thread' or 'process'.")
+
+        lazy = kwargs.pop("lazy", False)
+        mobs = [cls(graph=item, lazy=True, **kwargs) for item in inputs]
+        if lazy:
+            return [mob.prefetch() for mob in mobs]
+        if any(mob.sampling_path is None for mob in mobs):
+            return [mob._ensure_built() for mob in mobs]
+
+        with pool_cls(max_workers=max_workers) as pool:
+            if executor == "thread":
+                futures = [pool.submit(mob._spectrum_inputs) for mob in mobs]
+                for mob, future in zip(mobs, futures):
+                    mob._given_spectrum = future.result()
+            else:
+                pending = []
+                for mob in mobs:
+                    freqs = sorted_freqs(mob._spectrum_order)
+                    spectrum_cache, cache_key = mob._spectrum_cache(mob._spectrum_order)
+                    cached = spectrum_cache.load(cache_key) if spectrum_cache else None
+                    if cached is not None:
+                        mob._given_spectrum = (freqs, cached[1], None)
+                        continue
+                    mob._samples = sample_path(mob.sampling_path, mob.n_samples)
+                    future = pool.submit(fourier_coefficients, mob._samples, freqs)
+                    pending.append((mob, freqs, future, spectrum_cache, cache_key))
+
+                for mob, freqs, future, spectrum_cache, cache_key in pending:
+                    coefficients = future.result()
+                    if spectrum_cache is not None:
+                        spectrum_cache.store(cache_key, freqs, coefficients)
+                    mob._given_spectrum = (freqs, coefficients, None)
+
+        return [mob._ensure_built() for mob in mobs]
+
+    @classmethod
+    def from_spectrum(cls, path, **kwargs):
+        """Build a FourierCircles from a spectrum file written by `save_spectrum`.
+
+        The vector count active when the file was saved is restored unless `n_vectors` /
+        `vector_number` is given; the rest of the stored spectrum stays available to
+        `set_vector_count`.
+        """
+        spectrum = load_spectrum_file(path)
+        if "vector_number" not in kwargs:
+            kwargs.setdefault("n_vectors", spectrum["n_vectors"])
+        mob = cls(
+            freqs=spectrum["freqs"],
+            coefficients=spectrum["coefficients"],
+            chains=spectrum["chains"],
+            **kwargs,
+        )
+        mob.source = spectrum["source"]
+        mob.n_samples = spectrum["n_samples"]
+        mob.fit_transform = spectrum["fit_transform"]
+        return mob
+
+    def save_spectrum(self, path, dtype=np.complex64):
+        """Write the full (scaled, pruned) spectrum to a compact `.npz` file.
+
+        Records the source identity, `n_samples`, `scale_factor`, the auto-fit transform and
+        the number of active vectors next to the frequencies and `dtype` coefficients.
+        """
+        self._ensure_built()
+        save_spectrum_file(
+            path,
+            self.spectrum.freqs,
+            self.spectrum.coefficients,
+            chains=self.spectrum.chains,
+            source=self.source,
+            n_samples=self.n_samples,
+            n_vectors=len(self._active) - 1,
+            scale_factor=self.scale_factor,
+            fit_transform=self.fit_transform,
+            dtype=dtype,
+        )
+        return self
 
-        for i, v in enumerate(self.vectors):
-            z = v.coeff * np.exp(TAU * 1j * v.freq * t)
-            offset = np.array([z.real, z.imag, 0])
+    def _spectrum_cache(self, order):
+        """(SpectrumCache, key) of the sampled spectrum up to `order`, or (None, None)."""
+        if not self._cache or not hasattr(self.sampling_path, "get_points"):
+            return None, None
+        cache_key = _spectrum_cache_key(
+            self.sampling_path, self.n_samples, order, self._fit_params
+        )
+        return SpectrumCache(self._cache_dir), cache_key
+
+    def _compute_spectrum(self, order):
+        """Sampled (freqs, coefficients) up to `order`, before `scale_factor` is applied."""
+        freqs = sorted_freqs(order)
+        spectrum_cache, cache_key = self._spectrum_cache(order)
+        cached = spectrum_cache.load(cache_key) if spectrum_cache is not None else None
+        if cached is not None:
+            return freqs, cached[1]
+
+        if self._samples is None:
+            self._samples = sample_path(self.sampling_path, self.n_samples)
+        coefficients = fourier_coefficients(self._samples, freqs)
+        if spectrum_cache is not None:
+            spectrum_cache.store(cache_key, freqs, coefficients)
+        return freqs, coefficients
+
+    def _compute_contour_spectrum(self):
+        """(freqs, coefficients, chains) of every subpath of the graph, before scaling."""
+        contours = []
+        for member in self.graph.family_members_with_points():
+            contours.extend(member.get_subpaths())
+        n_points_per_curve = getattr(self.graph, "n_points_per_cubic_curve", 4)
+
+        spectrum_cache = None
+        cache_key = None
+        if self._cache:
+            spectrum_cache = SpectrumCache(self._cache_dir)
+            cache_key = spectrum_key(
+                np.concatenate(contours) if contours else np.zeros((0, 3)),
+                n_samples=self.n_samples,
+                n_vectors=self.n_vectors,
+                fit=self._fit_params,
+                contours=[len(c) for c in contours],
+            )
+            cached = spectrum_cache.load(cache_key)
+            if cached is not None and cached[2] is not None:
+                return cached
+
+        freqs, coefficients, chains = contour_spectra(
+            contours, self.n_samples, self.n_vectors, n_points_per_curve
+        )
+        if spectrum_cache is not None:
+            spectrum_cache.store(cache_key, freqs, coefficients, chains)
+        return freqs, coefficients, chains
+
+    def _set_spectrum(self, freqs, coefficients, chains=None):
+        """Store the scaled spectrum, dropping coefficients rejected by the pruning options."""
+        coefficients = self.scale_factor * np.asarray(coefficients, dtype=complex)
+        if chains is None:
+            chains = np.zeros(len(coefficients), dtype=int)
+        chains = np.asarray(chains, dtype=int)
+        min_radius = None
+        if self.min_radius_px is not None:
+            min_radius = self.min_radius_px * config.frame_width / config.pixel_width
+
+        self._total_energy = float(np.sum(np.abs(coefficients) ** 2))
+        keep = prune_spectrum(coefficients, self.energy_fraction, min_radius)
+        if len(chains) and chains.min() != chains.max():
+            # The first entry of every chain anchors it; never prune a chain away entirely.
+            keep[np.r_[0, np.flatnonzero(np.diff(chains)) + 1]] = True
+        self.spectrum = Spectrum(
+            np.asarray(freqs)[keep], coefficients[keep], chains[keep], self.precision
+        )
+        self.n_pruned = int(len(keep) - np.count_nonzero(keep))
+        if self.n_pruned:
+            logger.info(
+                f"FourierCircles: pruned {self.n_pruned} of {len(keep)} vectors "
+                "below the energy/radius threshold."
+            )
 
-            self.circles[i].move_to(current_pos)
-            v.put_start_and_end_on(current_pos, current_pos + offset)
-            current_pos = v.get_end()
+    def _vector_count_for_error(self, max_error_px):
+        """Smallest `n_vectors` whose RMS error is below `max_error_px` output pixels.
+
+        Pruned coefficients count towards the error. For sampled inputs the chosen prefix is
+        mapped back to an order, so `_active_count` selects the same entries.
+        """
+        max_error = max_error_px * config.frame_width / config.pixel_width
+        index = vector_count_for_error(
+            self.spectrum.coefficients, max_error, self._total_energy
+        )
+        if self.sampling_path is None:
+            n_vectors = index
+        else:
+            # Orders are ranges -n//2 .. n//2: an even n adds +n/2, an odd n adds -(n+1)/2.
+            f = self.spectrum.freqs[index] if len(self.spectrum) else 0
+            n_vectors = int(2 * abs(f) - (f < 0))
+        logger.info(
+            f"FourierCircles: {n_vectors} vectors for an RMS error below {max_error_px} px."
+        )
+        return n_vectors
+
+    def _active_count(self, n_vectors):
+        """Number of leading spectrum entries with |f| within order `n_vectors`."""
+        low, high = -n_vectors // 2, n_vectors // 2
+        freqs = self.spectrum.freqs
+        return int(np.count_nonzero((freqs >= low) & (freqs <= high)))
+
+    def _unit_circle(self, n_curves):
+        """Complex points of a unit circle made of `n_curves` cubic arcs (flat mode)."""
+        if n_curves not in self._unit_circles:
+            points = Circle(radius=1, num_components=n_curves + 1).get_points()
+            self._unit_circles[n_curves] = points[:, 0] + 1j * points[:, 1]
+        return self._unit_circles[n_curves]
+
+    def _add_vector(self, c):
+        mag = float(np.abs(c))
+        # Same proportions as Arrow: the tip is capped at a quarter of the length.
+        tip_length = min(DEFAULT_ARROW_TIP_LENGTH, 0.25 * mag)
+        n_curves = 8
+        show_vector = True
+        show_tip = self.vector_type == "arrow"
+        if self.level_of_detail:
+            pixels_per_unit = config.pixel_width / config.frame_width
+            n_curves = circle_curve_count(mag * pixels_per_unit)
+            show_vector = mag * pixels_per_unit >= 0.5
+            show_tip = show_tip and tip_length * pixels_per_unit >= LOD_MIN_TIP_PX
+
+        if self.render_mode == "flat":
+            empty = np.zeros(0, dtype=complex)
+            templates = [self._unit_circle(n_curves) * mag if n_curves else empty]
+            if show_tip:
+                base = mag - tip_length
+                templates.append(corner_template([0, base]))
+                templates.append(corner_template([
+                    mag, base + 0.5j * tip_length, base - 0.5j * tip_length, mag
+                ]))
+            else:
+                templates.append(corner_template([0, mag]) if show_vector else empty)
+                if self.vector_type == "arrow":
+                    templates.append(empty)
+            self._vector_templates.append(list(zip(self._flat_members, templates)))
+            return
+
+        # Skipped submobjects stay as empty placeholders so circles and vectors keep
+        # lining up with the spectrum entries (set_vector_count slices them by index).
+        if n_curves:
+            circle = Circle(radius=mag, num_components=n_curves + 1)
+        else:
+            circle = VMobject()
+        circle.set_stroke(**self._circle_style)
+        self.circles.add(circle)
+
+        if not show_vector:
+            vec = VMobject()
+        elif show_tip:
+            vec = Arrow(ORIGIN, mag * RIGHT, buff=0)
+        else:
+            vec = Line(ORIGIN, mag * RIGHT)
+        vec.set_stroke(**self._vector_style)
+        self.vectors.add(vec)
+
+        templates = []
+        members = [*circle.family_members_with_points(), *vec.family_members_with_points()]
+        for mob in members:
+            points = mob.get_points()
+            templates.append((mob, points[:, 0] + 1j * points[:, 1]))
+        self._vector_templates.append(templates)
+
+    def set_vector_count(self, n_vectors):
+        """Grow or shrink the chain in place to `n_vectors + 1` frequencies.
+
+        Coefficients come from the spectrum computed at construction (see `max_vectors`);
+        only the missing circles/vectors are created, or the surplus ones removed.
+        """
+        if self.contours == "all":
+            raise ValueError("set_vector_count is not supported with contours='all'.")
+        self._ensure_built()
+        if self.sampling_path is not None:
+            if n_vectors > self._spectrum_order:
+                freqs, coefficients = self._compute_spectrum(n_vectors)
+                self._spectrum_order = n_vectors
+                self._set_spectrum(freqs, coefficients)
+            n_active = self._active_count(n_vectors)
+        else:
+            n_active = n_vectors + 1
+            if n_active > len(self.spectrum):
+                raise ValueError(
+                    f"Only {len(self.spectrum)} frequencies are available; "
+                    "pass a larger spectrum or an input graph."
+                )
+
+        # Keep the submobjects of the unchanged leading frequencies, rebuild the rest.
+        n_common = min(len(self._active), n_active)
+        same = (self._active.freqs[:n_common] == self.spectrum.freqs[:n_common]) & (
+            self._active.coefficients[:n_common] == self.spectrum.coefficients[:n_common]
+        )
+        n_keep = n_common if same.all() else int(np.argmin(same))
+
+        if self.render_mode != "flat":
+            self.circles.remove(*self.circles.submobjects[n_keep:])
+            self.vectors.remove(*self.vectors.submobjects[n_keep:])
+        del self._vector_templates[n_keep:]
+        for c in self.spectrum.coefficients[n_keep:n_active]:
+            self._add_vector(c)
+
+        self.n_vectors = n_vectors
+        self._active = self.spectrum[:n_active]
+        self._build_templates()
+        self._update_epicycles(self, 0)
+        return self
+
+    def _build_templates(self):
+        """Concatenate the per-vector point templates recorded by `_add_vector`.
+
+        Each submobject was built at the origin for a phasor of magnitude |c| pointing
+        along +x, so its points at time t are `template * z / |c| + start`, where z is the
+        rotated phasor and start the chain position of its vector. Templates are grouped
+        by the mobject they are written to, so in flat mode every mobject gets one
+        contiguous slice holding the subpaths of all vectors (see `concat_templates`).
+        """
+        members, bounds, owner, template = concat_templates(self._vector_templates)
+
+        chains = self._active.chains
+        # Chains are contiguous runs of entries; record where each one starts and ends.
+        chain_starts = np.r_[0, np.flatnonzero(np.diff(chains)) + 1]
+        chain_ends = np.r_[chain_starts[1:], len(chains)]
+        self._chain_last = chain_ends - 1
+        self._chain_first = np.repeat(chain_starts, chain_ends - chain_starts)
+        magnitudes = np.abs(self._active.coefficients)
+        self._build_magnitudes = np.where(magnitudes > 0, magnitudes, 1.0)
+
+        complex_dtype = PRECISIONS[self.precision][1]
+        self._template_members = members
+        self._template_bounds = bounds
+        self._template_owner = owner
+        self._template = template.astype(complex_dtype)
+        self._build_keyframes()
+
+    def _build_keyframes(self):
+        """Tabulate the running chain sums at `keyframes` clock samples over one period.
+
+        Row k holds `[0, cumsum(phasors)]` at t = k / keyframes as float32 (real, imag)
+        pairs. Integer frequencies repeat every clock unit, so one period covers all t.
+        """
+        self._keyframe_table = None
+        if self.keyframes is None:
+            return
+        freqs, coefficients = self._active.freqs, self._active.coefficients
+        if np.any(np.mod(freqs, 1) != 0):
+            logger.warning(
+                "FourierCircles: keyframes need integer frequencies; "
+                "falling back to direct evaluation."
+            )
+            return
+        ts = np.arange(self.keyframes) / self.keyframes
+        totals = evaluate_chain(freqs, coefficients, ts, joints=True)
+        self._keyframe_table = np.stack([totals.real, totals.imag], axis=-1).astype(np.float32)
+
+    def _chain_totals(self, t):
+        """`[0, cumsum(phasors)]` at clock `t`, from the keyframe table when there is one."""
+        table = self._keyframe_table
+        if table is None:
+            return chain_totals(self._active.freqs, self._active.coefficients, t)
+        position = (t % 1.0) * len(table)
+        index = int(position)
+        weight = position - index
+        row = (1 - weight) * table[index % len(table)] + weight * table[(index + 1) % len(table)]
+        return row[:, 0] + 1j * row[:, 1]
+
+    def _update_epicycles(self, mob, dt=0):
+        # One cumsum over all chains; subtracting each chain's running total at its first
+        # entry restarts every chain at the origin.
+        totals = self._chain_totals(self.vector_clock.get_value())
+        phasors = np.diff(totals)
+        base = totals[self._chain_first]
+        starts = totals[:-1] - base
+        if len(phasors):
+            ends = totals[self._chain_last + 1] - base[self._chain_last]
+            self._end_points = to_points(ends)
+
+        points = to_points(place_templates(
+            self._template, self._template_owner, phasors, starts, self._build_magnitudes
+        ))
+
+        bounds = self._template_bounds
+        for mob, start, end in zip(self._template_members, bounds[:-1], bounds[1:]):
+            mob.set_points(points[start:end])
+
+    def set_coefficients(self, coefficients):
+        """Replace the coefficients of the active vectors in place, keeping their frequencies.
+
+        Nothing is rebuilt: every submobject keeps the template it was built with and is
+        rotated and scaled to its new phasor, so this costs one epicycle update. A vector
+        built with a zero coefficient stays degenerate. `set_vector_count` restores the
+        spectrum coefficients.
+        """
+        self._ensure_built()
+        coefficients = np.asarray(coefficients, dtype=complex)
+        if coefficients.shape != (len(self._active),):
+            raise ValueError(
+                f"Expected {len(self._active)} coefficients, got {coefficients.shape}."
+            )
+        self._active = Spectrum(
+            self._active.freqs, coefficients, self._active.chains, self.precision
+        )
+        self._build_keyframes()
+        self._update_epicycles(self, 0)
+        return self
 
     def get_end(self):
-        return self.vectors[-1].get_end()
+        self._ensure_built()
+        return self._end_points[-1].copy()
+
+    def get_chain_end(self, index):
+        """Tip of chain `index` (see `contours="all"`); `n_chains` gives the count."""
+        self._ensure_built()
+        return self._end_points[index].copy()
+
+    @property
+    def n_chains(self):
+        self._ensure_built()
+        return len(self._chain_last)
+
+    def evaluate(self, ts, joints=False, chain=-1):
+        """Positions of chain `chain` at every clock value in `ts`, without touching submobjects.
+
+        Returns the tip positions as an array of shape (len(ts), 3), or with `joints=True`
+        every joint of the chain, shape (len(ts), n + 1, 3): the origin followed by the end
+        of each of its n vectors (the last joint is the tip). Evaluated as one phasor
+        matrix product (tips) or cumsum (joints), see `evaluate_chain`.
+        """
+        self._ensure_built()
+        first = self._chain_first[self._chain_last[chain]]
+        last = self._chain_last[chain] + 1
+        z = evaluate_chain(
+            self._active.freqs[first:last], self._active.coefficients[first:last], ts, joints
+        )
+        return to_points(z)
 
     def start_orient(self, speed=1.0):
+        self._ensure_built()
         if self._orient_updater is not None:
             try:
                 self.remove_updater(self._orient_updater)
@@ -190,6 +886,8 @@ class FourierCircles(VGroup):
             mob.vector_clock.set_value(mob.vector_clock.get_value() + speed * dt)
 
         self._orient_updater = _updater
+        if self.stats is not None:
+            self._orient_updater = self.stats.wrap("orient", _updater, touched=lambda mob: 1)
         self.add_updater(self._orient_updater)
 
         try:
@@ -200,6 +898,7 @@ class FourierCircles(VGroup):
         return self
 
     def set_value(self, value):
+        self._ensure_built()
         self.vector_clock.set_value(value)
         self._update_epicycles(self, 0)
         return self
@@ -0,0 +1,96 @@
+from manimlib import *
+import numpy as np
+
+from mobjects.epicycle_core import (
+    chain_totals,
+    concat_templates,
+    fourier_coefficients,
+    place_templates,
+    sample_bezier_path,
+    sorted_freqs,
+    to_points,
+)
+
+
+def sample_gl_path(path, n_samples):
+    """Sample a manimgl VMobject at `n_samples` uniform arc-length proportions, as complex."""
+    # manimgl 1.7 returns a generator of (anchor, handle, anchor) tuples.
+    tuples = np.array(list(path.get_bezier_tuples()))
+    control_points = tuples.reshape(-1, tuples.shape[-1])
+    points = sample_bezier_path(control_points, n_samples, n_points_per_curve=tuples.shape[1])
+    return points[:, 0] + 1j * points[:, 1]
+
+
+class GLFourierCircles(VGroup):
+    """Epicycle chain for manimgl scenes, built on `mobjects.epicycle_core`.
+
+    The manimgl counterpart of `FourierCircles`: samples `path` (a manimgl VMobject) and
+    computes the `n_vectors + 1` coefficients with one FFT. Every frame, the chain is
+    evaluated with `chain_totals` and the points of all circles and lines are placed from
+    their templates in one `place_templates` pass, driven by `vector_clock`. Use `get_end()`
+    with `TracedPath` to draw the curve.
+    """
+    def __init__(
+        self,
+        path,
+        n_vectors=100,
+        n_samples=2000,
+        vector_clock=None,
+        circle_color=BLUE_C,
+        circle_stroke_width=1,
+        circle_opacity=0.2,
+        vector_color=WHITE,
+        vector_stroke_width=1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.freqs = np.array(sorted_freqs(n_vectors))
+        self.coefficients = fourier_coefficients(sample_gl_path(path, n_samples), self.freqs)
+        self.vector_clock = vector_clock if vector_clock is not None else ValueTracker(0)
+
+        self.circles = VGroup()
+        self.vectors = VGroup()
+        vector_templates = []
+        for c in self.coefficients:
+            mag = np.abs(c)
+            circle = Circle(radius=mag)
+            circle.set_stroke(circle_color, width=circle_stroke_width, opacity=circle_opacity)
+            self.circles.add(circle)
+
+            vec = Line(ORIGIN, mag * RIGHT)
+            vec.set_stroke(vector_color, width=vector_stroke_width)
+            self.vectors.add(vec)
+
+            templates = []
+            for mob in [*circle.family_members_with_points(), *vec.family_members_with_points()]:
+                points = mob.get_points()
+                templates.append((mob, points[:, 0] + 1j * points[:, 1]))
+            vector_templates.append(templates)
+
+        self.add(self.circles, self.vectors)
+        (
+            self._template_members,
+            self._template_bounds,
+            self._template_owner,
+            self._template,
+        ) = concat_templates(vector_templates)
+        magnitudes = np.abs(self.coefficients)
+        self._build_magnitudes = np.where(magnitudes > 0, magnitudes, 1.0)
+        self._end = np.zeros(3)
+        self.add_updater(lambda m: m.update_chain())
+        self.update_chain()
+
+    def update_chain(self):
+        totals = chain_totals(self.freqs, self.coefficients, self.vector_clock.get_value())
+        points = to_points(place_templates(
+            self._template, self._template_owner, np.diff(totals), totals[:-1],
+            self._build_magnitudes,
+        ))
+        bounds = self._template_bounds
+        for mob, start, end in zip(self._template_members, bounds[:-1], bounds[1:]):
+            mob.set_points(points[start:end])
+        self._end = to_points(totals[-1])
+        return self
+
+    def get_end(self):
+        return self._end.copy()
@@ -0,0 +1,153 @@
+from manim import logger
+import numpy as np
+import os
+import time
+
+
+PROFILE_ENV = "FOURIER_PROFILE"
+
+# Stats created while a `FourierProfileMixin` scene is rendering; the scene owns the list
+# and reports it in `tear_down`. None outside such scenes, so nothing accumulates.
+_collector = None
+
+
+def profiling_enabled(profile=None):
+    """Resolve an explicit `profile=` flag, falling back to `$FOURIER_PROFILE`."""
+    if profile is not None:
+        return bool(profile)
+    return os.environ.get(PROFILE_ENV, "").lower() not in ("", "0", "false", "no")
+
+
+class UpdaterStats:
+    """Per-frame timings of instrumented updaters.
+
+    Every call of a wrapped updater records its duration and the number of submobjects it
+    touched under the updater's name; watched traces also record the bytes held by their
+    point arrays. `callback(name, seconds, touched)` is called after each record, if given.
+    """
+
+    def __init__(self, name="", callback=None):
+        self.name = name
+        self.callback = callback
+        self.timings = {}
+        self.touched = {}
+        self.trace_bytes = {}
+        if _collector is not None:
+            _collector.append(self)
+
+    def __deepcopy__(self, memo):
+        # Copied mobjects keep the instrumented updaters, which record here; share the stats.
+        return self
+
+    def record(self, name, seconds, touched=0):
+        self.timings.setdefault(name, []).append(seconds)
+        self.touched.setdefault(name, []).append(touched)
+        if self.callback is not None:
+            self.callback(name, seconds, touched)
+
+    def wrap(self, name, updater, touched=None):
+        """Return a timing wrapper around the `(mob, dt)` updater `updater`.
+
+        `touched(mob)` gives the submobject count to record; defaults to the mob's family
+        size. Both callables get the mob as an argument rather than closing over it, so the
+        wrapper keeps driving the right mobject after `Mobject.copy()`.
+        """
+        def _timed(mob, dt):
+            start = time.perf_counter()
+            updater(mob, dt)
+            seconds = time.perf_counter() - start
+            count = touched(mob) if touched is not None else len(mob.get_family())
+            self.record(name, seconds, count)
+
+        _timed.__wrapped__ = updater
+        return _timed
+
+    def watch_trace(self, trace, name=None):
+        """Instrument the updaters of `trace` (`TracedPath`, `FourierTrace`, ...) in place.
+
+        Besides timings, records the bytes held by the trace's point arrays every frame.
+        """
+        name = name or type(trace).__name__
+        for updater in list(trace.get_updaters()):
+            trace.remove_updater(updater)
+
+            def _traced(mob, dt, updater=updater):
+                start = time.perf_counter()
+                updater(mob, dt)
+                seconds = time.perf_counter() - start
+                family = mob.get_family()
+                self.trace_bytes.setdefault(name, []).append(
+                    sum(m.points.nbytes for m in family)
+                )
+                self.record(name, seconds, len(family))
+
+            _traced.__wrapped__ = updater
+            trace.add_updater(_traced)
+        return trace
+
+    def total_time(self):
+        return sum(sum(times) for times in self.timings.values())
+
+    def summary(self):
+        """Dict of per-updater frame counts, timing statistics (ms) and trace memory."""
+        result = {}
+        for name, times in self.timings.items():
+            times = np.asarray(times) * 1000
+            entry = dict(
+                frames=len(times),
+                total_ms=float(times.sum()),
+                mean_ms=float(times.mean()),
+                p95_ms=float(np.percentile(times, 95)),
+                max_ms=float(times.max()),
+                mean_touched=float(np.mean(self.touched[name])),
+            )
+            if name in self.trace_bytes:
+                entry["trace_bytes"] = int(self.trace_bytes[name][-1])
+                entry["peak_trace_bytes"] = int(max(self.trace_bytes[name]))
+            result[name] = entry
+        return result
+
+    def report(self):
+        lines = [f"FourierCircles profile {self.name}".rstrip()]
+        for name, entry in self.summary().items():
+            line = (
+                f"  {name}: {entry['frames']} frames, {entry['total_ms']:.1f} ms total, "
+                f"mean {entry['mean_ms']:.3f} ms, p95 {entry['p95_ms']:.3f} ms, "
+                f"max {entry['max_ms']:.3f} ms, {entry['mean_touched']:.0f} submobjects"
+            )
+            if "trace_bytes" in entry:
+                line += f", trace {entry['trace_bytes'] / 1024:.1f} KiB"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class FourierProfileMixin:
+    """Scene mixin logging the stats of every instrumented mobject after `construct`.
+
+    Use as `class MyScene(FourierProfileMixin, Scene)`. Time not spent in instrumented
+    updaters (animations, Manim's own rasterization, file writing) is reported as `other`.
+    Does nothing unless profiling is enabled.
+    """
+
+    def setup(self):
+        global _collector
+        super().setup()
+        self._profile_start = time.perf_counter()
+        self.profile_stats = _collector = []
+
+    def tear_down(self):
+        global _collector
+        super().tear_down()
+        _collector = None
+        if not self.profile_stats:
+            return
+        wall = time.perf_counter() - self._profile_start
+        instrumented = 0.0
+        for stats in self.profile_stats:
+            logger.info(stats.report())
+            instrumented += stats.total_time()
+        logger.info(
+            f"FourierCircles profile: {wall:.2f} s wall, {instrumented:.2f} s in "
+            f"instrumented updaters, {wall - instrumented:.2f} s other"
+        )
+        self.profile_stats.clear()
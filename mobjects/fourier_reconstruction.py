@@ -0,0 +1,53 @@
+from manim import *
+import numpy as np
+
+from mobjects.epicycle_core import reconstruct_series
+
+
+class FourierReconstruction(VMobject):
+    """Static curve drawn by a `FourierCircles` over one full period.
+
+    Reconstructs the truncated series (the n-term approximation the epicycles actually
+    trace, not the input shape) with one inverse FFT per chain, so a "final drawing"
+    preview or reference outline appears instantly instead of after an animated period.
+
+    - `n_points`: samples per chain (raised as needed to exceed 2 * max|f|).
+    - `smooth`: join the samples with smooth Bézier handles instead of straight segments.
+    - `chain`: only reconstruct this chain of `contours="all"` epicycles (default: all of
+      them, as separate subpaths).
+    - Call `refresh()` after `set_vector_count(...)` to follow the new vector count.
+
+    Requires integer frequencies, which repeat every clock unit.
+    """
+    def __init__(self, epicycles, n_points=1024, smooth=True, chain=None, **kwargs):
+        super().__init__(**kwargs)
+        self.epicycles = epicycles
+        self.n_points = n_points
+        self.smooth = smooth
+        self.chain = chain
+        self.refresh()
+
+    def refresh(self):
+        epicycles = self.epicycles
+        chains = range(epicycles.n_chains) if self.chain is None else [self.chain]
+        self.clear_points()
+        for chain in chains:
+            last = epicycles._chain_last[chain]
+            first = epicycles._chain_first[last]
+            z = reconstruct_series(
+                epicycles.freqs[first:last + 1],
+                epicycles.coefficients[first:last + 1],
+                self.n_points,
+            )
+            points = np.zeros((len(z) + 1, 3))
+            points[:-1, 0] = z.real
+            points[:-1, 1] = z.imag
+            points[-1] = points[0]
+
+            path = VMobject()
+            if self.smooth:
+                path.set_points_smoothly(points)
+            else:
+                path.set_points_as_corners(points)
+            self.append_points(path.points)
+        return self
@@ -0,0 +1,132 @@
+import numpy as np
+
+
+SPECTRUM_FORMAT_VERSION = 1
+
+# (real dtype for non-integer frequencies, complex dtype for coefficients) per precision.
+PRECISIONS = {
+    "double": (np.float64, np.complex128),
+    "single": (np.float32, np.complex64),
+}
+
+
+class Spectrum:
+    """Frequencies, coefficients and chain indices of an epicycle spectrum.
+
+    Stored as contiguous, read-only NumPy arrays. A spectrum is treated as a value:
+    `copy.copy` / `copy.deepcopy` return the same object, so copies of a mobject (including
+    the ones Manim's animations make) share it, and slicing returns views. `precision`
+    is "double" (complex128) or "single" (complex64, with int32 / float32 frequencies).
+    """
+    __slots__ = ("freqs", "coefficients", "chains")
+
+    def __init__(self, freqs, coefficients, chains=None, precision="double"):
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}; use 'double' or 'single'.")
+        real_dtype, complex_dtype = PRECISIONS[precision]
+        freqs = np.asarray(freqs)
+        if np.all(np.mod(freqs, 1) == 0):
+            real_dtype = np.int32 if precision == "single" else np.int64
+        if chains is None:
+            chains = np.zeros(len(freqs), dtype=np.int32)
+        self._set(
+            np.array(freqs, dtype=real_dtype),
+            np.array(coefficients, dtype=complex_dtype),
+            np.array(chains, dtype=np.int32),
+        )
+        if not len(self.freqs) == len(self.coefficients) == len(self.chains):
+            raise ValueError("freqs, coefficients and chains must have the same length.")
+
+    def _set(self, freqs, coefficients, chains):
+        for name, array in (("freqs", freqs), ("coefficients", coefficients), ("chains", chains)):
+            array.flags.writeable = False
+            object.__setattr__(self, name, array)
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError("Spectrum only supports slicing.")
+        view = object.__new__(Spectrum)
+        view._set(self.freqs[index], self.coefficients[index], self.chains[index])
+        return view
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def nbytes(self):
+        return self.freqs.nbytes + self.coefficients.nbytes + self.chains.nbytes
+
+
+def save_spectrum_file(
+    path,
+    freqs,
+    coefficients,
+    chains=None,
+    source="",
+    n_samples=0,
+    n_vectors=None,
+    scale_factor=1.0,
+    fit_transform=None,
+    dtype=np.complex64,
+):
+    """Write an epicycle spectrum to an `.npz` file.
+
+    Integer frequencies are stored as int32 and coefficients as `dtype` (complex64 by
+    default), next to the metadata needed to interpret them: the source identity,
+    `n_samples`, `scale_factor`, the auto-fit transform `(scale, offset)` and the active
+    vector count `n_vectors`, i.e. the first `n_vectors + 1` entries (default: all).
+    `chains` holds the chain index of every coefficient for multi-contour spectra.
+    """
+    freqs = np.asarray(freqs)
+    if chains is None:
+        chains = np.zeros(len(freqs))
+    if np.all(np.mod(freqs, 1) == 0):
+        freqs = freqs.astype(np.int32)
+    if fit_transform is None:
+        fit_transform = (1.0, np.zeros(3))
+    if n_vectors is None:
+        n_vectors = len(freqs) - 1
+    scale, offset = fit_transform
+
+    with open(path, "wb") as f:
+        np.savez(
+            f,
+            version=np.int32(SPECTRUM_FORMAT_VERSION),
+            freqs=freqs,
+            coefficients=np.asarray(coefficients, dtype=dtype),
+            chains=np.asarray(chains, dtype=np.int32),
+            source=np.str_(source),
+            n_samples=np.int64(n_samples),
+            n_vectors=np.int64(n_vectors),
+            scale_factor=np.float64(scale_factor),
+            fit_transform=np.concatenate([[scale], np.asarray(offset, dtype=float)]),
+        )
+
+
+def load_spectrum_file(path):
+    """Read a file written by `save_spectrum_file` into a dict of its fields."""
+    with np.load(path) as data:
+        version = int(data["version"])
+        if version > SPECTRUM_FORMAT_VERSION:
+            raise ValueError(
+                f"{path}: spectrum format version {version} is newer than supported "
+                f"({SPECTRUM_FORMAT_VERSION})."
+            )
+        fit_transform = data["fit_transform"]
+        return dict(
+            freqs=data["freqs"],
+            coefficients=data["coefficients"],
+            chains=data["chains"],
+            source=str(data["source"]),
+            n_samples=int(data["n_samples"]),
+            # Files written before n_vectors was recorded use the whole spectrum.
+            n_vectors=int(data["n_vectors"]) if "n_vectors" in data else len(data["freqs"]) - 1,
+            scale_factor=float(data["scale_factor"]),
+            fit_transform=(float(fit_transform[0]), fit_transform[1:]),
+        )
@@ -0,0 +1,79 @@
+from manim import *
+import numpy as np
+
+
+class FourierTrace(VMobject):
+    """Trace of a `FourierCircles` tip, evaluated from its Fourier series.
+
+    Unlike `TracedPath`, which appends one point per frame, every frame re-evaluates the
+    partial sum over the clock window [t0, t] at a fixed number of points, so memory and
+    per-frame cost do not grow with scene length and fast clocks leave no gaps.
+
+    - `n_points`: point budget for the whole visible trace.
+    - `start_time`: clock value where the trace begins (defaults to the current clock).
+    - `time_window`: only show the last `time_window` clock units (like `dissipating_time`).
+    - `fade_segments`: split the trace into this many pieces with opacity ramping up
+      towards the tip; 1 disables fading.
+    - `chain`: which chain to trace for `contours="all"` epicycles (default: the last one).
+
+    When the epicycles are instrumented (`profile=True`), the trace registers itself with
+    their `stats`.
+    """
+    def __init__(
+        self,
+        epicycles,
+        n_points=1000,
+        start_time=None,
+        time_window=None,
+        fade_segments=1,
+        stroke_color=YELLOW,
+        stroke_width=3,
+        stroke_opacity=1.0,
+        chain=-1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.epicycles = epicycles
+        self.n_points = n_points
+        self.start_time = (
+            epicycles.vector_clock.get_value() if start_time is None else start_time
+        )
+        self.time_window = time_window
+        self.chain = chain
+
+        fade_segments = max(1, int(fade_segments))
+        for i in range(fade_segments):
+            segment = VMobject()
+            opacity = stroke_opacity * (i + 1) / fade_segments
+            segment.set_stroke(stroke_color, width=stroke_width, opacity=opacity)
+            self.add(segment)
+
+        self.add_updater(self._update_trace)
+        if epicycles.stats is not None:
+            epicycles.stats.watch_trace(self)
+        self._update_trace(self)
+
+    def _update_trace(self, mob, dt=0):
+        self.epicycles._ensure_built()
+        t = self.epicycles.vector_clock.get_value()
+        t0 = self.start_time
+        if self.time_window is not None and t - t0 > self.time_window:
+            t0 = t - self.time_window
+        # Integer frequencies repeat every clock unit; drawing more than one period only
+        # spreads the point budget over overlapping copies of the same curve.
+        if t - t0 > 1 and np.all(np.mod(self.epicycles.freqs, 1) == 0):
+            t0 = t - 1
+
+        segments = self.submobjects
+        if t == t0:
+            for segment in segments:
+                segment.clear_points()
+            return
+
+        # Adjacent segments share their boundary sample so the pieces join up.
+        n = max(2 * len(segments), self.n_points)
+        points = self.epicycles.evaluate(np.linspace(t0, t, n), chain=self.chain)
+
+        bounds = np.linspace(0, n - 1, len(segments) + 1).astype(int)
+        for segment, start, end in zip(segments, bounds[:-1], bounds[1:]):
+            segment.set_points_as_corners(points[start:end + 1])
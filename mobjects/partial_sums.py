@@ -0,0 +1,88 @@
+from manim import *
+import numpy as np
+
+from mobjects.phase_wave import axes_transform, x_grid
+
+
+class PartialSumSeries:
+    """Running partial sums of a series, evaluated once per term on a fixed x grid.
+
+    `terms` is an iterable (possibly infinite, e.g. a generator) of vectorized callables
+    `term(xs)` or of precomputed arrays. Each term is evaluated once, on demand, and added
+    to a running cumulative array, so the n-th partial sum costs O(len(xs)) on top of the
+    previous ones instead of re-summing every term at every sample.
+    """
+    def __init__(self, terms, xs=None, x_range=(-5, 5, 0.1)):
+        self.xs = np.asarray(xs, dtype=float) if xs is not None else x_grid(x_range)
+        self._terms = iter(terms)
+        self._term_values = []
+        self._partial_sums = [np.zeros_like(self.xs)]
+
+    @classmethod
+    def from_coefficients(cls, coefficients, basis, **kwargs):
+        """Series `sum_k coefficients[k] * basis(k, xs)` for any coefficient iterable."""
+        return cls(
+            (lambda xs, k=k, c=c: c * basis(k, xs) for k, c in enumerate(coefficients)),
+            **kwargs,
+        )
+
+    @classmethod
+    def sine_series(cls, amplitudes, frequencies, **kwargs):
+        """Series `sum_k amplitudes[k] * sin(frequencies[k] * x)`."""
+        return cls(
+            (lambda xs, a=a, w=w: a * np.sin(w * xs) for a, w in zip(amplitudes, frequencies)),
+            **kwargs,
+        )
+
+    @classmethod
+    def sign_series(cls, half_period=4, **kwargs):
+        """Square-wave series of sgn(x) on (-half_period, half_period):
+        `4/pi * sum_k sin((2k+1) pi x / half_period) / (2k+1)`."""
+        odd = range(1, 1 << 30, 2)
+        return cls.sine_series(
+            (4 / (PI * n) for n in odd), (n * PI / half_period for n in odd), **kwargs
+        )
+
+    def __len__(self):
+        return len(self._term_values)
+
+    def _extend(self, n_terms):
+        while len(self._term_values) < n_terms:
+            try:
+                term = next(self._terms)
+            except StopIteration:
+                raise IndexError(
+                    f"Series has only {len(self._term_values)} terms, {n_terms} requested."
+                ) from None
+            values = term(self.xs) if callable(term) else term
+            values = np.broadcast_to(np.asarray(values, dtype=float), self.xs.shape)
+            self._term_values.append(values)
+            self._partial_sums.append(self._partial_sums[-1] + values)
+
+    def term(self, k):
+        """Values of the k-th term (0-based) on the grid."""
+        self._extend(k + 1)
+        return self._term_values[k]
+
+    def partial_sum(self, n_terms):
+        """Values of the sum of the first `n_terms` terms on the grid."""
+        self._extend(n_terms)
+        return self._partial_sums[n_terms]
+
+    def _graph(self, axes, ys, use_smoothing=True, **kwargs):
+        origin, x_unit, y_unit = axes_transform(axes)
+        points = origin + np.outer(self.xs, x_unit) + np.outer(ys, y_unit)
+        graph = VMobject(**kwargs)
+        if use_smoothing:
+            graph.set_points_smoothly(points)
+        else:
+            graph.set_points_as_corners(points)
+        return graph
+
+    def get_term_graph(self, axes, k, **kwargs):
+        """Graph of the k-th term on `axes` (kwargs as for `VMobject`)."""
+        return self._graph(axes, self.term(k), **kwargs)
+
+    def get_graph(self, axes, n_terms, **kwargs):
+        """Graph of the partial sum of the first `n_terms` terms on `axes`."""
+        return self._graph(axes, self.partial_sum(n_terms), **kwargs)
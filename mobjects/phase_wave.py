@@ -0,0 +1,75 @@
+from manim import *
+import numpy as np
+
+
+def axes_transform(axes):
+    """Origin and unit vectors of linearly scaled `axes`, as scene-space arrays.
+
+    A graph point (x, y) maps to `origin + x * x_unit + y * y_unit`.
+    """
+    origin = np.asarray(axes.coords_to_point(0, 0), dtype=float)
+    x_unit = np.asarray(axes.coords_to_point(1, 0), dtype=float) - origin
+    y_unit = np.asarray(axes.coords_to_point(0, 1), dtype=float) - origin
+    return origin, x_unit, y_unit
+
+
+def x_grid(x_range):
+    """Sample grid for `x_range=[x_min, x_max, x_step]`, including x_max like `Axes.plot`."""
+    x_min, x_max = x_range[0], x_range[1]
+    x_step = x_range[2] if len(x_range) > 2 else (x_max - x_min) / 100
+    return np.append(np.arange(x_min, x_max, x_step), x_max)
+
+
+class PhaseWave(VMobject):
+    """Graph of a vectorized function on fixed axes, recomputed in place every frame.
+
+    Replaces `always_redraw(lambda: axes.plot(func, x_range=...))` for waves whose shape
+    depends on a phase `ValueTracker`: the x grid and the axes-to-scene transform are
+    computed once, and each frame evaluates `func` on the whole grid and overwrites the
+    existing point array, so no mobject is allocated per frame.
+
+    - `func(xs)` (or `func(xs, phi)` when a `phi` tracker is given) must accept and return
+      NumPy arrays.
+    - `x_range=[x_min, x_max, x_step]` as for `Axes.plot`; assumes linearly scaled axes.
+    - Call `refresh_transform()` after moving the axes.
+    """
+    def __init__(self, axes, func, x_range=None, phi=None, **kwargs):
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.func = func
+        self.phi = phi
+
+        if x_range is None:
+            x_range = axes.x_range
+        self.xs = x_grid(x_range)
+
+        self.refresh_transform()
+        self.set_points_as_corners(self._anchors())
+        self.add_updater(self._update_wave)
+
+    def refresh_transform(self):
+        origin, x_unit, self._y_unit = axes_transform(self.axes)
+        self._baseline = origin + np.outer(self.xs, x_unit)
+        return self
+
+    def _anchors(self):
+        if self.phi is None:
+            ys = self.func(self.xs)
+        else:
+            ys = self.func(self.xs, self.phi.get_value())
+        ys = np.broadcast_to(np.asarray(ys, dtype=float), self.xs.shape)
+        return self._baseline + np.outer(ys, self._y_unit)
+
+    def _update_wave(self, mob, dt=0):
+        anchors = self._anchors()
+        points = self.points
+        if points.shape != (4 * (len(anchors) - 1), 3):
+            # An animation replaced the point array; restore the straight-segment layout.
+            self.set_points_as_corners(anchors)
+            return
+
+        starts, ends = anchors[:-1], anchors[1:]
+        points[0::4] = starts
+        points[1::4] = (2 * starts + ends) / 3
+        points[2::4] = (starts + 2 * ends) / 3
+        points[3::4] = ends
@@ -0,0 +1,214 @@
+"""Render a long FourierCircles clock sweep in parallel chunks.
+
+An epicycle sweep is a pure function of `vector_clock`, and `FourierTrace` rebuilds the
+trace from the clock alone, so the frames of a sweep can be split into contiguous chunks,
+rendered by separate processes (one scene per chunk, seeded to the chunk's first clock
+value) and joined with ffmpeg's concat demuxer without re-encoding.
+
+    python -c 'from manim import MathTex; from mobjects.fourier_circles import FourierCircles; \
+        FourierCircles(input_graph=MathTex(r"\\pi"), vector_number=100).save_spectrum("pi.npz")'
+    python render_parallel.py pi.npz --t-end 2 --duration 30 -o pi.mp4 --processes 8
+
+Only the sweep itself is rendered here (the equivalent of `start_orient(...)` followed by
+`self.wait(duration)`); intro animations such as `Create(epicycles)` are left to the scene.
+"""
+
+from manim import *
+import numpy as np
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from mobjects.fourier_circles import FourierCircles
+from mobjects.fourier_trace import FourierTrace
+
+
+class EpicycleChunkScene(Scene):
+    """Frames `first_frame .. first_frame + n_frames - 1` of a linear clock sweep.
+
+    Frame k of the whole sweep shows the clock at `t_start + k * clock_step`; the trace
+    always starts at `t_start`, so every chunk draws it exactly as a serial render would.
+    """
+
+    def __init__(
+        self,
+        spectrum_path,
+        t_start,
+        clock_step,
+        first_frame,
+        n_frames,
+        epicycle_kwargs=None,
+        trace_kwargs=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.spectrum_path = spectrum_path
+        self.t_start = t_start
+        self.clock_step = clock_step
+        self.first_frame = first_frame
+        self.n_frames = n_frames
+        self.epicycle_kwargs = epicycle_kwargs or {}
+        self.trace_kwargs = dict(stroke_color=YELLOW, stroke_width=3)
+        self.trace_kwargs.update(trace_kwargs or {})
+
+    def construct(self):
+        epicycles = FourierCircles.from_spectrum(self.spectrum_path, **self.epicycle_kwargs)
+        epicycles.set_value(self.t_start + self.first_frame * self.clock_step)
+        trace = FourierTrace(epicycles, start_time=self.t_start, **self.trace_kwargs)
+        self.add(trace, epicycles)
+
+        fps = config.frame_rate
+        # Manim renders the frames at t = 0, 1/fps, ... < run_time; half a frame short of
+        # n_frames / fps keeps the count exact despite float rounding.
+        run_time = (self.n_frames - 0.5) / fps
+
+        def _set_clock(mob, alpha):
+            frame = self.first_frame + int(round(alpha * run_time * fps))
+            mob.set_value(self.t_start + frame * self.clock_step)
+
+        self.play(UpdateFromAlphaFunc(epicycles, _set_clock), run_time=run_time, rate_func=linear)
+
+
+def _render_chunk(task):
+    """Render one chunk in a worker process and return its movie file path."""
+    index, chunk_dir, quality, scene_kwargs = task
+    with tempconfig({
+        "quality": quality,
+        "media_dir": chunk_dir,
+        "output_file": f"chunk_{index:04d}",
+        "disable_caching": True,
+        "preview": False,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }):
+        scene = EpicycleChunkScene(**scene_kwargs)
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def concat_movies(paths, output):
+    """Join movie files with identical encoding settings without re-encoding them."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+        list_path = f.name
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", list_path,
+                "-c", "copy", output,
+            ],
+            check=True,
+        )
+    finally:
+        os.remove(list_path)
+    return output
+
+
+def render_parallel(
+    spectrum,
+    t_start,
+    t_end,
+    duration,
+    output,
+    chunks=None,
+    processes=None,
+    quality="high_quality",
+    epicycle_kwargs=None,
+    trace_kwargs=None,
+    keep_chunks=False,
+):
+    """Render the clock sweep `t_start -> t_end` over `duration` seconds into `output`.
+
+    `spectrum` is a file written by `FourierCircles.save_spectrum`, or a `FourierCircles`
+    (saved to a temporary file first). The frames are split into `chunks` contiguous
+    pieces (default: one per process) rendered by a pool of `processes` workers.
+    `epicycle_kwargs` and `trace_kwargs` are passed to `FourierCircles.from_spectrum` and
+    `FourierTrace` in every worker.
+    """
+    work_dir = tempfile.mkdtemp(prefix="fourier_chunks_")
+    try:
+        if isinstance(spectrum, FourierCircles):
+            spectrum_path = os.path.join(work_dir, "spectrum.npz")
+            spectrum.save_spectrum(spectrum_path)
+        else:
+            spectrum_path = os.path.abspath(spectrum)
+
+        with tempconfig({"quality": quality}):
+            fps = config.frame_rate
+        total_frames = max(1, int(round(duration * fps)))
+        clock_step = (t_end - t_start) / total_frames
+        processes = processes or os.cpu_count() or 1
+        chunks = max(1, min(chunks or processes, total_frames))
+        bounds = np.linspace(0, total_frames, chunks + 1).astype(int)
+
+        tasks = []
+        for index, (first, last) in enumerate(zip(bounds[:-1], bounds[1:])):
+            scene_kwargs = dict(
+                spectrum_path=spectrum_path,
+                t_start=t_start,
+                clock_step=clock_step,
+                first_frame=int(first),
+                n_frames=int(last - first),
+                epicycle_kwargs=epicycle_kwargs,
+                trace_kwargs=trace_kwargs,
+            )
+            chunk_dir = os.path.join(work_dir, f"chunk_{index:04d}")
+            tasks.append((index, chunk_dir, quality, scene_kwargs))
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            movies = list(pool.map(_render_chunk, tasks))
+
+        return concat_movies(movies, output)
+    finally:
+        if keep_chunks:
+            logger.info(f"Chunk renders kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("spectrum", help="spectrum file written by FourierCircles.save_spectrum")
+    parser.add_argument("--t-start", type=float, default=0.0)
+    parser.add_argument("--t-end", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of video")
+    parser.add_argument("-o", "--output", default="epicycles.mp4")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--chunks", type=int, default=None)
+    parser.add_argument(
+        "-q", "--quality", default="h", choices=["l", "m", "h", "p", "k"],
+        help="Manim quality preset (low, medium, high, 1440p, 4k)",
+    )
+    parser.add_argument("--vector-type", default="arrow", choices=["arrow", "line"])
+    parser.add_argument("--keep-chunks", action="store_true")
+    args = parser.parse_args(argv)
+
+    qualities = dict(
+        l="low_quality",
+        m="medium_quality",
+        h="high_quality",
+        p="production_quality",
+        k="fourk_quality",
+    )
+    render_parallel(
+        args.spectrum,
+        args.t_start,
+        args.t_end,
+        args.duration,
+        args.output,
+        chunks=args.chunks,
+        processes=args.processes,
+        quality=qualities[args.quality],
+        epicycle_kwargs=dict(vector_type=args.vector_type),
+        keep_chunks=args.keep_chunks,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Tests for the renderer-free epicycle core; they need only NumPy and pytest."""
+
+import numpy as np
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+from mobjects import epicycle_core
+from mobjects.epicycle_core import (
+    TAU,
+    chain_totals,
+    evaluate_chain,
+    fourier_coefficients,
+    prune_spectrum,
+    reconstruct_series,
+    sample_bezier_path,
+    sorted_freqs,
+    vector_count_for_error,
+)
+
+
+def _reference_coefficients(complex_points, freqs):
+    t_range = np.arange(len(complex_points)) / len(complex_points)
+    return np.array([np.mean(complex_points * np.exp(-TAU * 1j * f * t_range)) for f in freqs])
+
+
+def _random_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n) + 1j * rng.normal(size=n)
+
+
+def _square_control_points(half_size=1.0):
+    """Cubic control points of a square drawn as four straight Bézier curves."""
+    corners = half_size * np.array([[1, 1], [-1, 1], [-1, -1], [1, -1]], dtype=float)
+    points = []
+    for start, end in zip(corners, np.roll(corners, -1, axis=0)):
+        for u in (0, 1 / 3, 2 / 3, 1):
+            points.append([*(start + u * (end - start)), 0.0])
+    return np.array(points)
+
+
+def test_fourier_coefficients_fft_path_matches_reference():
+    points = _random_points(2000)
+    freqs = sorted_freqs(50)
+    np.testing.assert_allclose(
+        fourier_coefficients(points, freqs), _reference_coefficients(points, freqs), atol=1e-12
+    )
+
+
+def test_fourier_coefficients_direct_path_matches_reference(monkeypatch):
+    # 2003 is prime and 11 bins are few, so the requested bins are evaluated directly.
+    points = _random_points(2003, seed=1)
+    freqs = sorted_freqs(10)
+
+    def no_fft(*args, **kwargs):
+        raise AssertionError("expected the direct DFT path")
+
+    monkeypatch.setattr(epicycle_core.np.fft, "fft", no_fft)
+    np.testing.assert_allclose(
+        fourier_coefficients(points, freqs), _reference_coefficients(points, freqs), atol=1e-12
+    )
+
+
+def test_fourier_coefficients_rejects_empty_input():
+    with pytest.raises(ValueError):
+        fourier_coefficients([], [0])
+
+
+def test_sample_bezier_path_square_uniform_arc_length():
+    samples = sample_bezier_path(_square_control_points(), 8)
+    expected = [[1, 1], [0, 1], [-1, 1], [-1, 0], [-1, -1], [0, -1], [1, -1], [1, 0]]
+    np.testing.assert_allclose(samples[:, :2], expected, atol=1e-12)
+
+    samples = sample_bezier_path(_square_control_points(), 400)
+    np.testing.assert_allclose(np.abs(samples[:, :2]).max(axis=1), 1.0, atol=1e-12)
+    steps = np.linalg.norm(np.diff(samples, axis=0), axis=1)
+    # Steps that turn a corner are shorter in straight-line distance.
+    straight = steps[np.abs(np.diff(samples[:, 0])) * np.abs(np.diff(samples[:, 1])) == 0]
+    np.testing.assert_allclose(straight, 8 / 400, atol=1e-12)
+
+
+def test_reconstruct_series_matches_direct_sum():
+    rng = np.random.default_rng(2)
+    freqs = np.array(sorted_freqs(10))
+    coefficients = rng.normal(size=len(freqs)) + 1j * rng.normal(size=len(freqs))
+
+    curve = reconstruct_series(freqs, coefficients, 64)
+    ts = np.arange(len(curve)) / len(curve)
+    direct = np.exp(TAU * 1j * np.outer(ts, freqs)) @ coefficients
+    assert len(curve) == 64
+    np.testing.assert_allclose(curve, direct, atol=1e-12)
+
+
+def test_reconstruct_series_never_aliases():
+    curve = reconstruct_series([0, 5, -7], [1, 0.5, 0.25], n_points=4)
+    assert len(curve) >= 15
+    ts = np.arange(len(curve)) / len(curve)
+    direct = 1 + 0.5 * np.exp(TAU * 5j * ts) + 0.25 * np.exp(-TAU * 7j * ts)
+    np.testing.assert_allclose(curve, direct, atol=1e-12)
+
+
+def test_fourier_coefficients_round_trip_through_reconstruct_series():
+    # 45 samples carry exactly the 45 frequencies -22 .. 22, so the round trip is exact.
+    points = _random_points(45, seed=3)
+    freqs = sorted_freqs(44)
+    coefficients = fourier_coefficients(points, freqs)
+    np.testing.assert_allclose(reconstruct_series(freqs, coefficients, 45), points, atol=1e-12)
+
+
+def test_vector_count_for_error():
+    coefficients = [3, 4, 0]
+    assert vector_count_for_error(coefficients, 4.0) == 0
+    assert vector_count_for_error(coefficients, 3.9) == 1
+    assert vector_count_for_error(coefficients, 0.0) == 1
+    assert vector_count_for_error(coefficients, 100.0) == 0
+    # Energy outside the given prefix cannot be removed: fall back to the last index.
+    assert vector_count_for_error(coefficients, 0.0, total_energy=30.0) == 2
+    assert vector_count_for_error([], 1.0) == 0
+
+
+def test_prune_spectrum():
+    assert prune_spectrum([]).tolist() == []
+    assert prune_spectrum([3, 4, 1]).tolist() == [True, True, True]
+    assert prune_spectrum([3, 4, 1], energy_fraction=1).tolist() == [True, True, True]
+    assert prune_spectrum([3, 4, 1], energy_fraction=0.6).tolist() == [False, True, False]
+    assert prune_spectrum([3, 4, 1], energy_fraction=0.9).tolist() == [True, True, False]
+    assert prune_spectrum([3, 4, 1], min_radius=2).tolist() == [True, True, False]
+    # The largest coefficient survives any threshold.
+    assert prune_spectrum([3, 4, 1], min_radius=10).tolist() == [False, True, False]
+    assert prune_spectrum([0, 0]).tolist() == [True, True]
+
+
+def test_evaluate_chain_joints_and_tips():
+    rng = np.random.default_rng(4)
+    freqs = np.array(sorted_freqs(12))
+    coefficients = rng.normal(size=len(freqs)) + 1j * rng.normal(size=len(freqs))
+    ts = np.linspace(0, 1, 37)
+
+    tips = evaluate_chain(freqs, coefficients, ts)
+    joints = evaluate_chain(freqs, coefficients, ts, joints=True)
+    assert tips.shape == (37,)
+    assert joints.shape == (37, len(freqs) + 1)
+    np.testing.assert_allclose(joints[:, 0], 0)
+    np.testing.assert_allclose(joints[:, -1], tips, atol=1e-12)
+    for t, row in zip(ts, joints):
+        np.testing.assert_allclose(row, chain_totals(freqs, coefficients, t), atol=1e-12)
+
+
+def test_core_imports_without_manim():
+    code = "import sys, mobjects.epicycle_core; sys.exit('manim' in sys.modules)"
+    root = Path(__file__).resolve().parents[1]
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0